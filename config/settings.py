@@ -4,11 +4,12 @@ This module centralizes all magic numbers and configurable parameters.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 import glm
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraSettings:
     """Camera-related configuration."""
     # Default zoom distance from origin
@@ -27,7 +28,7 @@ class CameraSettings:
     RESET_ZOOM_MULTIPLIER: float = 5.0
 
 
-@dataclass
+@dataclass(slots=True)
 class InputSettings:
     """Input handling configuration."""
     # Mouse sensitivity values
@@ -39,7 +40,7 @@ class InputSettings:
     MATRIX_DETERMINANT_THRESHOLD: float = 1e-10
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderingSettings:
     """Rendering and graphics configuration."""
     # Default background color (RGB)
@@ -56,7 +57,7 @@ class RenderingSettings:
     AMBIENT_STRENGTH: float = 0.3
     
 
-@dataclass
+@dataclass(slots=True)
 class MeshSettings:
     """Mesh processing configuration."""
     # Validation limits
@@ -69,7 +70,7 @@ class MeshSettings:
     DUMMY_RAY_DIRECTION: Tuple[float, float, float] = (0.0, 0.0, -1.0)
 
 
-@dataclass
+@dataclass(slots=True)
 class UISettings:
     """User interface configuration."""
     # Default window dimensions
@@ -83,9 +84,18 @@ class UISettings:
     # Viewport limits
     MAX_TEXTURE_SIZE: int = 8192
     MIN_VIEWPORT_SIZE: int = 1
+    VIEWPORT_SIZE_STEP: int = 4  # resize the render target in steps of this many pixels
+    
+    # Frame pacing: without user input, redraw at IDLE_FPS instead of continuously
+    ENABLE_IDLING: bool = True
+    IDLE_FPS: float = 9.0
+    # Waiting for the monitor's vertical sync caps interaction at the refresh rate
+    VSYNC_TO_MONITOR: bool = False
+    # Frame rate cap while not idling when vsync is off; 0 would spin the main thread
+    MAX_FPS: int = 120
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreadingSettings:
     """Threading and async operation configuration."""
     # Thread pool configuration
@@ -95,9 +105,11 @@ class ThreadingSettings:
     # Task timeouts and delays
     TASK_UPDATE_INTERVAL: float = 0.016  # ~60 FPS
     PROGRESS_REPORT_INTERVAL: float = 0.1
+    # GPU upload work per frame once meshes are loaded (at least one mesh per frame)
+    MESH_UPLOAD_BYTES_PER_FRAME: int = 16 * 1024 * 1024  # 16MB
 
 
-@dataclass
+@dataclass(slots=True)
 class FileSettings:
     """File handling configuration."""
     # Supported mesh file extensions
@@ -114,9 +126,22 @@ class FileSettings:
         "~/Downloads",
         "./meshes"
     )
+    
+    # Parsed-geometry cache, so reloading an unchanged file skips the parser
+    MESH_CACHE_ENABLED: bool = True
+    MESH_CACHE_DIR: str = "~/.cache/mesh_viewer"
+    MESH_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024  # 1GB
+    
+    # Recently deleted meshes kept in memory so reloading them skips parsing
+    RECENT_MESH_CACHE_SIZE: int = 8
+    
+    # Skip trimesh's vertex merging, validation and material loading when
+    # parsing files. Much faster for clean exports, but unmerged vertices
+    # raise the reported vertex counts and can show seams in smooth shading
+    FAST_MESH_LOADING: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class GeometrySettings:
     """Geometry creation configuration."""
     # Axis arrow parameters
@@ -160,42 +185,51 @@ class AppConfig:
 config = AppConfig()
 
 
-# Convenience functions for common config access
+# Convenience functions for common config access.
+# The global config sections are never rebound, so each lookup is cached.
+@lru_cache(maxsize=None)
 def get_camera_config() -> CameraSettings:
     """Get camera configuration."""
     return config.camera
 
 
+@lru_cache(maxsize=None)
 def get_input_config() -> InputSettings:
     """Get input configuration."""
     return config.input
 
 
+@lru_cache(maxsize=None)
 def get_rendering_config() -> RenderingSettings:
     """Get rendering configuration."""
     return config.rendering
 
 
+@lru_cache(maxsize=None)
 def get_mesh_config() -> MeshSettings:
     """Get mesh configuration."""
     return config.mesh
 
 
+@lru_cache(maxsize=None)
 def get_ui_config() -> UISettings:
     """Get UI configuration."""
     return config.ui
 
 
+@lru_cache(maxsize=None)
 def get_threading_config() -> ThreadingSettings:
     """Get threading configuration."""
     return config.threading
 
 
+@lru_cache(maxsize=None)
 def get_file_config() -> FileSettings:
     """Get file configuration."""
     return config.files
 
 
+@lru_cache(maxsize=None)
 def get_geometry_config() -> GeometrySettings:
     """Get geometry configuration."""
     return config.geometry
@@ -1,6 +1,9 @@
 import glm
 from config import get_camera_config
 
+# Config section is resolved once; attribute values stay live for runtime tweaks
+_camera_config = get_camera_config()
+
 class ArcballCamera:
     """
     A simple camera that maintains a fixed orientation and zooms by moving along its Z-axis.
@@ -11,7 +14,7 @@ class ArcballCamera:
         self.height = height
         
         # Load configuration
-        camera_config = get_camera_config()
+        camera_config = _camera_config
         self.zoom = camera_config.DEFAULT_ZOOM
 
         # Fixed rotation for a nice isometric-style view
@@ -24,6 +27,7 @@ class ArcballCamera:
         self._view_dirty = True
         self._projection_dirty = True
         self._cached_position = None
+        self._inv_view_proj = None
         
         self.set_viewport(width, height)
 
@@ -31,7 +35,7 @@ class ArcballCamera:
         self.width = width
         self.height = height
         
-        camera_config = get_camera_config()
+        camera_config = _camera_config
         aspect = width / float(height) if height > 0 else 1.0
         self._projection = glm.perspective(
             glm.radians(camera_config.FIELD_OF_VIEW), 
@@ -40,6 +44,7 @@ class ArcballCamera:
             camera_config.FAR_PLANE
         )
         self._projection_dirty = False  # Just calculated
+        self._inv_view_proj = None
 
     def get_view_matrix(self) -> glm.mat4:
         """Get view matrix with caching for performance."""
@@ -54,6 +59,9 @@ class ArcballCamera:
             final_up = glm.vec3(rot_mat * glm.vec4(up, 0.0))
 
             self._view = glm.lookAt(final_eye_pos, glm.vec3(0, 0, 0), final_up)
+            # Share the rotated eye position with the `position` property
+            self._cached_position = final_eye_pos
+            self._inv_view_proj = None
             self._view_dirty = False
             
         return self._view
@@ -65,9 +73,9 @@ class ArcballCamera:
     def position(self) -> glm.vec3:
         """Get camera's current world-space position with caching."""
         if self._cached_position is None or self._view_dirty:
-            eye_pos = glm.vec3(0, 0, self.zoom)
-            rot_mat = glm.mat4_cast(self.rotation)
-            self._cached_position = glm.vec3(rot_mat * glm.vec4(eye_pos, 1.0))
+            # Computed alongside the view matrix to avoid a second mat4_cast
+            self._view_dirty = True
+            self.get_view_matrix()
         return self._cached_position
         
     def view_direction(self) -> glm.vec3:
@@ -77,12 +85,17 @@ class ArcballCamera:
     def screen_ray(self, x: float, y: float, width: int, height: int) -> glm.vec3:
         """Generates a ray from the camera through the specified screen coordinate."""
         view = self.get_view_matrix()
-        proj = self.get_projection_matrix()
-        viewport = glm.vec4(0, 0, width, height)
+        if self._inv_view_proj is None:
+            # Invert once and reuse until the view or projection changes
+            self._inv_view_proj = glm.inverse(self._projection * view)
+        inv_view_proj = self._inv_view_proj
 
-        p0 = glm.unProject(glm.vec3(x, height - y, 0.0), view, proj, viewport)
-        p1 = glm.unProject(glm.vec3(x, height - y, 1.0), view, proj, viewport)
-        return glm.normalize(p1 - p0)
+        # Same mapping as glm.unProject: window coords -> NDC on the near/far planes
+        ndc_x = 2.0 * x / width - 1.0
+        ndc_y = 2.0 * (height - y) / height - 1.0
+        p0 = inv_view_proj * glm.vec4(ndc_x, ndc_y, -1.0, 1.0)
+        p1 = inv_view_proj * glm.vec4(ndc_x, ndc_y, 1.0, 1.0)
+        return glm.normalize(glm.vec3(p1) / p1.w - glm.vec3(p0) / p0.w)
 
     def set_zoom(self, zoom: float):
         """Set zoom and mark view as dirty."""
@@ -5,6 +5,24 @@ from .scene import Scene
 from .camera import ArcballCamera
 from config import get_input_config
 
+# Config section is resolved once; attribute values stay live for runtime tweaks
+_input_config = get_input_config()
+
+
+def _closest_hit(locations: np.ndarray, origin: np.ndarray) -> tuple[int, float]:
+    """
+    Find the hit location closest to a ray origin.
+
+    Works on plain float arrays so the selection stays a single NumPy
+    reduction; squared distances preserve the ordering, so no sqrt is needed.
+    Returns the index of the closest location and its squared distance.
+    """
+    offsets = locations - origin
+    distances_sq = np.einsum('ij,ij->i', offsets, offsets)
+    nearest = int(distances_sq.argmin())
+    return nearest, float(distances_sq[nearest])
+
+
 class InputHandler:
     """
     Translates user input into scene transformations (rotation, translation).
@@ -15,6 +33,10 @@ class InputHandler:
         self.is_right_mouse_pressed = False
         self.last_mouse_pos = glm.vec2(0, 0)
         
+        # Single-ray buffers reused by every pick
+        self._ray_origin = np.empty((1, 3), dtype=np.float64)
+        self._ray_direction = np.empty((1, 3), dtype=np.float64)
+        
     def handle_press(self, button: int, pressed: bool, x: float, y: float):
         if button == 0:  # Left
             self.is_left_mouse_pressed = pressed
@@ -28,6 +50,10 @@ class InputHandler:
         current_pos = glm.vec2(x, y)
         delta = current_pos - self.last_mouse_pos
         self.last_mouse_pos = current_pos
+        
+        # Repeated events at the same position (e.g. from trackpads) change nothing
+        if delta.x == 0 and delta.y == 0:
+            return
 
         # We need the camera's orientation to define the correct axes for interaction
         view_mat = camera.get_view_matrix()
@@ -35,8 +61,7 @@ class InputHandler:
         cam_up_vec = glm.vec3(view_mat[0][1], view_mat[1][1], view_mat[2][1])
         
         if self.is_left_mouse_pressed:  # Rotate Scene
-            input_config = get_input_config()
-            sensitivity = input_config.ROTATION_SENSITIVITY
+            sensitivity = _input_config.ROTATION_SENSITIVITY
 
             # NEW, CORRECTED CODE uses camera's axes:
             # For horizontal mouse movement (delta.x), we rotate around the camera's "up" vector.
@@ -50,15 +75,13 @@ class InputHandler:
             scene.rotation = rot_horizontal * rot_vertical * scene.rotation
             
         elif self.is_right_mouse_pressed:  # Pan Scene (Translate)
-            input_config = get_input_config()
-            sensitivity = scene.scale * input_config.PAN_SENSITIVITY_FACTOR
+            sensitivity = scene.scale * _input_config.PAN_SENSITIVITY_FACTOR
             scene.translation += cam_right_vec * delta.x * sensitivity
             scene.translation -= cam_up_vec * delta.y * sensitivity
 
     def handle_wheel(self, scene: Scene, camera: ArcballCamera, delta: float):
         """Zooms by moving the scene towards/away from the fixed camera."""
-        input_config = get_input_config()
-        sensitivity = scene.scale * input_config.ZOOM_SENSITIVITY_FACTOR
+        sensitivity = scene.scale * _input_config.ZOOM_SENSITIVITY_FACTOR
         scene.translation += camera.view_direction() * delta * sensitivity
 
     def handle_pick(self, scene: Scene, camera: ArcballCamera, width: int, height: int, x: float, y: float):
@@ -66,18 +89,14 @@ class InputHandler:
         ray_dir_ws = camera.screen_ray(x, y, width, height)
         ray_origin_ws = camera.position
 
-        # Build the model matrix exactly as in the renderer
-        trans_mat = glm.translate(glm.mat4(1.0), scene.translation)
-        rot_mat = glm.mat4_cast(scene.rotation)
-        center_offset = glm.translate(glm.mat4(1.0), -scene.center)
-        model_mat = trans_mat * rot_mat * center_offset
+        # Use the same (cached) model matrix as the renderer
+        model_mat, _ = scene.get_model_matrix()
         
         # Calculate the inverse model matrix for transforming the ray
         # Add safety check to prevent crashes from singular matrices
         try:
-            input_config = get_input_config()
             det = glm.determinant(model_mat)
-            if abs(det) < input_config.MATRIX_DETERMINANT_THRESHOLD:
+            if abs(det) < _input_config.MATRIX_DETERMINANT_THRESHOLD:
                 # Matrix is singular/near-singular, cannot invert safely
                 return None
             inv_model_mat = glm.inverse(model_mat)
@@ -93,27 +112,27 @@ class InputHandler:
         closest_distance = float('inf')
         closest_mesh = None
 
+        # Fill the preallocated (1, 3) ray arrays in place and share them across all meshes
+        ray_origins = self._ray_origin
+        ray_directions = self._ray_direction
+        ray_origins[0] = origin_ms
+        ray_directions[0] = dir_ms
+
         for mesh in scene.meshes:
             if not mesh.visible: continue
             
             # Use numpy arrays for trimesh ray intersection
-            locs, idx, rays = mesh.intersector.intersects_location(
-                np.array([[origin_ms.x, origin_ms.y, origin_ms.z]]), 
-                np.array([[dir_ms.x, dir_ms.y, dir_ms.z]])
-            )
+            locs, idx, rays = mesh.intersector.intersects_location(ray_origins, ray_directions)
             
             if len(locs):
-                # Find the closest intersection point
-                for i, loc in enumerate(locs):
-                    # Calculate distance from ray origin to hit point
-                    hit_vec = glm.vec3(loc[0], loc[1], loc[2]) - origin_ms
-                    distance = glm.length(hit_vec)
-                    
-                    # Check if this is the closest hit so far
-                    if distance < closest_distance:
-                        closest_distance = distance
-                        closest_hit = loc
-                        closest_mesh = mesh
+                # Find the closest intersection point of this mesh
+                nearest, distance_sq = _closest_hit(locs, ray_origins)
+                
+                # Check if this is the closest hit so far
+                if distance_sq < closest_distance:
+                    closest_distance = distance_sq
+                    closest_hit = locs[nearest]
+                    closest_mesh = mesh
         
         if closest_mesh:
             closest_mesh.selected = not closest_mesh.selected
@@ -2,116 +2,360 @@ import moderngl
 import trimesh
 import numpy as np
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from config import get_mesh_config, get_threading_config
+
+# Shared pool that builds picking BVHs in the background, created on first use
+_bvh_executor = None
+
+
+def _get_bvh_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool used for BVH warmup."""
+    global _bvh_executor
+    if _bvh_executor is None:
+        threading_config = get_threading_config()
+        _bvh_executor = ThreadPoolExecutor(
+            max_workers=threading_config.DEFAULT_MAX_WORKERS,
+            thread_name_prefix=f"{threading_config.THREAD_NAME_PREFIX}-BVH"
+        )
+    return _bvh_executor
+
+
+def _finite_min_max(array: np.ndarray):
+    """Return (min, max) of an array, or (None, None) if it holds NaN or Inf values."""
+    a_min = array.min()
+    a_max = array.max()
+    if not (np.isfinite(a_min) and np.isfinite(a_max)):
+        return None, None
+    return float(a_min), float(a_max)
+
+
+def _max_unsigned(indices: np.ndarray):
+    """Return the max of an index array reinterpreted as unsigned, in a single pass."""
+    if indices.dtype.kind == 'i':
+        indices = indices.view(f'u{indices.dtype.itemsize}')
+    return indices.max()
+
+
+@dataclass(slots=True)
+class PreparedMeshData:
+    """Validated, GL-ready vertex data produced off the GL thread by Mesh.prepare_buffers()."""
+    vertices: np.ndarray
+    normals: np.ndarray
+    indices: np.ndarray
+
+
+@dataclass(slots=True)
+class MeshStats:
+    """Geometry statistics shown in the UI, computed once per mesh."""
+    vertex_count: int
+    face_count: int
+    size: tuple
+    area: float
+    volume: float
+    # Display text, formatted once along with the numbers as multi-line
+    # blocks so each can be submitted to ImGui in a single call
+    count_text: str = ""
+    measure_text: str = ""
+
+
+def _format_stats(stats: MeshStats) -> tuple:
+    """Format the count and measurement text blocks shown by the info panel."""
+    size = stats.size
+    count_lines = (
+        f"Vertices: {stats.vertex_count:,}",
+        f"Faces: {stats.face_count:,}",
+    )
+    measure_lines = (
+        "Bounding Box:",
+        f"  Size: {size[0]:.3f} × {size[1]:.3f} × {size[2]:.3f}",
+        f"Surface Area: {stats.area:.3f}",
+    )
+    if stats.volume > 0:
+        measure_lines += (f"Volume: {stats.volume:.3f}",)
+    return "\n".join(count_lines), "\n".join(measure_lines)
+
+
+class SharedMeshBuffers:
+    """
+    GL vertex and index buffers holding one or more meshes back to back.
+    
+    Meshes created together by Mesh.create_batch share one set of buffers and
+    each draws its own index range. The buffers are released once every mesh
+    using them has been released.
+    """
+    __slots__ = ("vbo_pos", "vbo_nrm", "ibo", "_users")
+
+    def __init__(self, ctx: moderngl.Context, vertices: np.ndarray, normals: np.ndarray,
+                 indices: np.ndarray, users: int):
+        # Keep positions and normals in separate buffers (SoA) so that
+        # position-only passes stream 12 bytes per vertex instead of 24.
+        # The arrays are C-contiguous, so moderngl reads them through the
+        # buffer protocol without an intermediate bytes copy
+        self.vbo_pos = ctx.buffer(vertices)
+        self.vbo_nrm = ctx.buffer(normals)
+        self.ibo = ctx.buffer(indices)
+        self._users = users
+
+    def release_user(self):
+        """Drop one mesh's reference, releasing the buffers after the last one."""
+        self._users -= 1
+        if self._users == 0:
+            self.vbo_pos.release()
+            self.vbo_nrm.release()
+            self.ibo.release()
 
-from trimesh.ray.ray_triangle import RayMeshIntersector
-from config import get_mesh_config
 
 class Mesh:
     """Encapsulates a single mesh's data, including trimesh object and OpenGL resources."""
-    def __init__(self, ctx: moderngl.Context, prog: moderngl.Program, trimesh_mesh: trimesh.Trimesh, name: str):
+    __slots__ = (
+        "ctx", "prog", "trimesh_mesh", "name", "_visible",
+        "_selected", "on_visibility_changed", "on_selection_changed", "vbo_pos", "vbo_nrm", "ibo", "vao",
+        "_buffers", "_index_first", "_index_count",
+        "_bvh_future", "_stats",
+    )
+
+    def __init__(self, ctx: moderngl.Context, prog: moderngl.Program, trimesh_mesh: trimesh.Trimesh, name: str,
+                 prepared: PreparedMeshData = None):
+        self._init_state(ctx, prog, trimesh_mesh, name)
+        
+        # Validate and prepare mesh data here unless a worker already did
+        if prepared is None:
+            prepared = self.prepare_buffers(trimesh_mesh)
+        buffers = SharedMeshBuffers(ctx, prepared.vertices, prepared.normals, prepared.indices, users=1)
+        self._attach_buffers(buffers, 0, prepared.indices.size)
+
+    @classmethod
+    def create_batch(cls, ctx: moderngl.Context, prog: moderngl.Program,
+                     items: Sequence[Tuple[trimesh.Trimesh, str, PreparedMeshData]]) -> List['Mesh']:
+        """
+        Create several meshes that share a single set of GL buffers.
+        
+        One upload per buffer replaces three per mesh, which keeps the GL
+        thread from stalling when many small meshes are loaded at once. The
+        shared buffers stay allocated until every mesh in the batch is released.
+        
+        Args:
+            items: (trimesh_mesh, name, prepared) per mesh; prepared may be None
+            
+        Returns:
+            The created meshes, in the order of `items`
+            
+        Raises:
+            ValueError: If any mesh's data is invalid
+        """
+        prepared_list = [prepared if prepared is not None else cls.prepare_buffers(trimesh_mesh)
+                         for trimesh_mesh, _, prepared in items]
+        
+        # Concatenate the meshes, baking each one's vertex offset into its indices
+        vertices = np.concatenate([prepared.vertices for prepared in prepared_list])
+        normals = np.concatenate([prepared.normals for prepared in prepared_list])
+        indices = np.empty(sum(prepared.indices.size for prepared in prepared_list), dtype='i4')
+        index_ranges = []
+        first = 0
+        vertex_offset = 0
+        for prepared in prepared_list:
+            count = prepared.indices.size
+            np.add(prepared.indices.reshape(-1), vertex_offset, out=indices[first:first + count])
+            index_ranges.append((first, count))
+            first += count
+            vertex_offset += len(prepared.vertices)
+        
+        buffers = SharedMeshBuffers(ctx, vertices, normals, indices, users=len(prepared_list))
+        meshes = []
+        for (trimesh_mesh, name, _), (first, count) in zip(items, index_ranges):
+            mesh = cls.__new__(cls)
+            mesh._init_state(ctx, prog, trimesh_mesh, name)
+            mesh._attach_buffers(buffers, first, count)
+            meshes.append(mesh)
+        return meshes
+
+    def _init_state(self, ctx: moderngl.Context, prog: moderngl.Program, trimesh_mesh: trimesh.Trimesh, name: str):
+        """Set up the CPU-side state shared by every construction path."""
         self.ctx = ctx
         self.prog = prog
         self.trimesh_mesh = trimesh_mesh
         self.name = name
 
-        self.visible = True
-        self.selected = False
-        
-        # Validate and prepare mesh data
-        self._validate_mesh_data(trimesh_mesh)
-        
-        vertices = self.trimesh_mesh.vertices.astype('f4')
-        indices = self.trimesh_mesh.faces.flatten().astype('i4') if hasattr(trimesh_mesh, 'faces') else np.arange(len(vertices)).astype('i4')
-        normals = self.trimesh_mesh.vertex_normals.astype('f4')
+        self._visible = True
+        self._selected = False
+        # Set by the owning Scene to hear about visibility/selection toggles
+        self.on_visibility_changed = None
+        self.on_selection_changed = None
 
-        # Optimize vertex data layout by interleaving vertices and normals
-        # This improves cache performance by keeping related data together
-        interleaved_data = np.column_stack((vertices, normals)).astype('f4')
-        
-        # Create OpenGL resources with interleaved data
-        self.vbo = self.ctx.buffer(interleaved_data.tobytes())
-        self.ibo = self.ctx.buffer(indices.tobytes())
+    def _attach_buffers(self, buffers: SharedMeshBuffers, index_first: int, index_count: int):
+        """Bind this mesh to its index range in (possibly shared) GL buffers."""
+        self._buffers = buffers
+        self.vbo_pos = buffers.vbo_pos
+        self.vbo_nrm = buffers.vbo_nrm
+        self.ibo = buffers.ibo
+        self._index_first = index_first
+        self._index_count = index_count
 
         self.vao = self.ctx.vertex_array(
             self.prog,
             [
-                (self.vbo, '3f 3f', 'in_position', 'in_normal'),
+                (self.vbo_pos, '3f', 'in_position'),
+                (self.vbo_nrm, '3f', 'in_normal'),
             ],
             self.ibo
         )
 
-        # Create the ray-mesh intersector and pre-compute acceleration structures
-        self.intersector = RayMeshIntersector(self.trimesh_mesh)
-        # Force initialization of the BVH tree by performing a dummy ray test
-        self._initialize_intersector()
+        # Build the ray-mesh intersector (and its BVH) on the shared pool so
+        # several meshes warm up in parallel without blocking the caller.
+        # The `intersector` property waits for this before the first pick
+        self._stats = None
+        self._bvh_future = _get_bvh_executor().submit(self._build_intersector)
+
+    @classmethod
+    def prepare_buffers(cls, trimesh_mesh: trimesh.Trimesh) -> PreparedMeshData:
+        """
+        Validate a mesh and convert it to GL-ready arrays without touching OpenGL.
+        
+        Safe to call from a worker thread, so the costly part of mesh creation
+        (validation, normal computation, dtype conversion) stays off the GL thread.
+        
+        Raises:
+            ValueError: If the mesh data is invalid
+        """
+        cls._validate_mesh_data(trimesh_mesh)
+        
+        vertices = np.ascontiguousarray(trimesh_mesh.vertices, dtype='f4')
+        faces = getattr(trimesh_mesh, 'faces', None)
+        indices = np.ascontiguousarray(faces, dtype='i4') if faces is not None else np.arange(len(vertices), dtype='i4')
+        normals = np.ascontiguousarray(trimesh_mesh.vertex_normals, dtype='f4')
+        return PreparedMeshData(vertices, normals, indices)
 
-    def _validate_mesh_data(self, trimesh_mesh: trimesh.Trimesh):
+    @staticmethod
+    def _validate_mesh_data(trimesh_mesh: trimesh.Trimesh):
         """Validate mesh data to prevent crashes and ensure data integrity."""
         if trimesh_mesh is None:
             raise ValueError("Mesh object cannot be None")
         
         # Check vertices
-        if not hasattr(trimesh_mesh, 'vertices') or len(trimesh_mesh.vertices) == 0:
+        # Fetch each (possibly lazily computed) attribute exactly once
+        vertices = getattr(trimesh_mesh, 'vertices', None)
+        if vertices is None or len(vertices) == 0:
             raise ValueError("Mesh has no vertices")
         
-        vertices = trimesh_mesh.vertices
         if len(vertices.shape) != 2 or vertices.shape[1] != 3:
             raise ValueError(f"Invalid vertex data shape: {vertices.shape}, expected (N, 3)")
         
-        # Check for invalid values in vertices
-        if np.any(np.isnan(vertices)) or np.any(np.isinf(vertices)):
+        # Check for invalid values and extreme coordinates in one pass:
+        # min/max propagate NaN/Inf, so no full-size temporaries are needed
+        v_min, v_max = _finite_min_max(vertices)
+        if v_min is None:
             raise ValueError("Mesh contains invalid vertex data (NaN or Inf values)")
         
         # Check vertex bounds to prevent extreme values
         mesh_config = get_mesh_config()
-        max_coord = np.max(np.abs(vertices))
+        max_coord = max(-v_min, v_max)
         if max_coord > mesh_config.MAX_COORDINATE_VALUE:
             raise ValueError(f"Mesh coordinates too large: max={max_coord:.2e}, limit={mesh_config.MAX_COORDINATE_VALUE}")
         
         # Check faces if they exist
-        if hasattr(trimesh_mesh, 'faces'):
-            faces = trimesh_mesh.faces 
+        faces = getattr(trimesh_mesh, 'faces', None)
+        if faces is not None:
             if len(faces) > 0:
                 if len(faces.shape) != 2 or faces.shape[1] != 3:
                     raise ValueError(f"Invalid face data shape: {faces.shape}, expected (N, 3)")
                 
                 # Check that face indices are valid
                 max_vertex_index = len(vertices) - 1
-                if np.max(faces) > max_vertex_index:
-                    raise ValueError("Face indices reference non-existent vertices")
-                
-                if np.min(faces) < 0:
+                if _max_unsigned(faces) > max_vertex_index:
+                    # Negative indices wrap to huge unsigned values, so one
+                    # reduction covers both bounds; tell them apart only on failure
+                    if np.max(faces) > max_vertex_index:
+                        raise ValueError("Face indices reference non-existent vertices")
                     raise ValueError("Face indices cannot be negative")
         
         # Check normals
-        if hasattr(trimesh_mesh, 'vertex_normals'):
-            normals = trimesh_mesh.vertex_normals
+        normals = getattr(trimesh_mesh, 'vertex_normals', None)
+        if normals is not None:
             if len(normals) != len(vertices):
                 raise ValueError(f"Normal count ({len(normals)}) doesn't match vertex count ({len(vertices)})")
             
-            if np.any(np.isnan(normals)) or np.any(np.isinf(normals)):
+            if _finite_min_max(normals)[0] is None:
                 raise ValueError("Mesh contains invalid normal data (NaN or Inf values)")
 
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool):
+        # UI code assigns this every frame, so only notify on actual changes
+        if value != self._visible:
+            self._visible = value
+            if self.on_visibility_changed is not None:
+                self.on_visibility_changed(self)
+
+    @property
+    def selected(self) -> bool:
+        return self._selected
+
+    @selected.setter
+    def selected(self, value: bool):
+        if value != self._selected:
+            self._selected = value
+            if self.on_selection_changed is not None:
+                self.on_selection_changed(self)
+
+    @property
+    def stats(self) -> MeshStats:
+        """Vertex/face counts and measurements, computed on first access and cached."""
+        if self._stats is None:
+            trimesh_mesh = self.trimesh_mesh
+            faces = getattr(trimesh_mesh, 'faces', None)
+            min_corner, max_corner = trimesh_mesh.bounds
+            # Geometry without faces (e.g. point clouds) has no area or volume
+            self._stats = MeshStats(
+                vertex_count=len(trimesh_mesh.vertices),
+                face_count=len(faces) if faces is not None else 0,
+                size=tuple((max_corner - min_corner).tolist()),
+                area=float(getattr(trimesh_mesh, 'area', 0.0)),
+                volume=float(getattr(trimesh_mesh, 'volume', 0.0)),
+            )
+            self._stats.count_text, self._stats.measure_text = _format_stats(self._stats)
+        return self._stats
+
+    @property
+    def intersector(self):
+        """Ray-mesh intersector, waiting for the background build if it is still running."""
+        return self._bvh_future.result()
+
     def render(self, color: tuple):
         """Renders the mesh."""
         self.prog['object_color'].value = color
-        self.vao.render()
+        self.vao.render(vertices=self._index_count, first=self._index_first)
+
+    def draw(self):
+        """Issues the draw call only, using the currently bound uniforms."""
+        self.vao.render(vertices=self._index_count, first=self._index_first)
 
-    def _initialize_intersector(self):
-        """Pre-compute the BVH tree for ray intersection by performing a dummy ray test."""
+    def _build_intersector(self):
+        """Create the ray-mesh intersector and pre-compute its BVH tree with a dummy ray test."""
+        from trimesh.ray.ray_triangle import RayMeshIntersector
+        intersector = RayMeshIntersector(self.trimesh_mesh)
         try:
             # Use a dummy ray far away from the mesh to avoid actual intersections
             # This will force the BVH tree to be built
             mesh_config = get_mesh_config()
             dummy_origin = np.array([mesh_config.DUMMY_RAY_ORIGIN])
             dummy_direction = np.array([mesh_config.DUMMY_RAY_DIRECTION])
-            self.intersector.intersects_any(dummy_origin, dummy_direction)
+            intersector.intersects_any(dummy_origin, dummy_direction)
         except Exception:
-            # Ignore any errors during initialization
+            # Ignore any errors during warmup; the first pick builds the tree instead
             pass
+        return intersector
 
     def release(self):
         """Releases OpenGL resources."""
-        self.vbo.release()
-        self.ibo.release()
-        self.vao.release()
\ No newline at end of file
+        self._bvh_future.cancel()
+        self.vao.release()
+        if self._buffers is not None:
+            self._buffers.release_user()
+            self._buffers = None
\ No newline at end of file
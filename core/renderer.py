@@ -1,5 +1,7 @@
 import moderngl
 import glm
+from itertools import filterfalse
+from operator import attrgetter
 from pathlib import Path
 
 from .scene import Scene
@@ -9,6 +11,67 @@ from utils.geometry import make_axis_arrow
 from config import get_rendering_config, get_ui_config
 from utils.logging import get_logger
 
+# Config sections are resolved once; attribute values stay live for runtime tweaks
+_rendering_config = get_rendering_config()
+
+_is_visible = attrgetter('visible')
+_is_selected = attrgetter('selected')
+
+# Fallback shaders used when the files in shaders/ cannot be read
+_FALLBACK_VERTEX_SHADER = """#version 330 core
+
+in vec3 in_position;
+in vec3 in_normal;
+
+layout(std140) uniform Transform {
+    mat4 model;
+    mat3 normal_matrix;
+};
+
+uniform mat4 view;
+uniform mat4 projection;
+
+out vec3 v_normal;
+out vec3 frag_pos;
+
+void main() {
+    gl_Position = projection * view * model * vec4(in_position, 1.0);
+    v_normal = normal_matrix * in_normal;
+    frag_pos = vec3(model * vec4(in_position, 1.0));
+}
+"""
+
+# Binding point and std140 layout of the `Transform` uniform block:
+# mat4 model (64 bytes) followed by mat3 normal_matrix, whose three
+# columns are each padded to a vec4 (48 bytes)
+_TRANSFORM_BINDING = 0
+_NORMAL_MATRIX_STD140_SIZE = 48
+
+_FALLBACK_FRAGMENT_SHADER = """#version 330 core
+
+in vec3 v_normal;
+in vec3 frag_pos;
+
+uniform vec3 light_pos;
+uniform vec3 view_pos;
+uniform vec3 object_color;
+
+out vec4 frag_color;
+
+void main() {
+    // Simple diffuse lighting
+    vec3 norm = normalize(v_normal);
+    vec3 light_dir = normalize(light_pos - frag_pos);
+    float diff = max(dot(norm, light_dir), 0.0);
+    
+    // Simple ambient + diffuse
+    vec3 ambient = 0.3 * object_color;
+    vec3 diffuse = diff * object_color;
+    
+    frag_color = vec4(ambient + diffuse, 1.0);
+}
+"""
+
 
 class Renderer:
     """Handles all OpenGL rendering logic."""
@@ -28,19 +91,26 @@ class Renderer:
         self.ctx.enable(moderngl.CULL_FACE)
         
         self.prog = self._load_shaders()
+        
+        # Model and normal matrices share one uniform buffer so each draw
+        # needs a single upload instead of two uniform writes
+        self._transform_ubo = self.ctx.buffer(reserve=64 + _NORMAL_MATRIX_STD140_SIZE)
+        self.prog['Transform'].binding = _TRANSFORM_BINDING
         self.axis_arrows = self._create_axis_arrows()
         
         self.fbo = None
         self.texture = None
+        self._uploaded_model_mat = None
+        self._axis_scale_factor = None
+        # Inputs of the last frame drawn into the FBO; an identical frame is skipped
+        self._last_frame_key = None
         self.resize(width, height)
 
     def _load_shaders(self):
         shader_dir = Path(__file__).parent.parent / "shaders"
         try:
-            with open(shader_dir / "mesh.vert") as f:
-                vertex_shader = f.read()
-            with open(shader_dir / "mesh.frag") as f:
-                fragment_shader = f.read()
+            vertex_shader = (shader_dir / "mesh.vert").read_text()
+            fragment_shader = (shader_dir / "mesh.frag").read_text()
         except (IOError, FileNotFoundError) as e:
             self.logger.warning(f"Could not load shader files: {e}")
             self.logger.info("Using fallback shaders")
@@ -58,63 +128,47 @@ class Renderer:
 
     def _get_fallback_vertex_shader(self) -> str:
         """Basic fallback vertex shader for when main shaders can't be loaded."""
-        return """
-        #version 330 core
-        
-        in vec3 in_position;
-        in vec3 in_normal;
-        
-        uniform mat4 model;
-        uniform mat4 view;
-        uniform mat4 projection;
-        uniform mat3 normal_matrix;
-        
-        out vec3 v_normal;
-        out vec3 frag_pos;
-        
-        void main() {
-            gl_Position = projection * view * model * vec4(in_position, 1.0);
-            v_normal = normal_matrix * in_normal;
-            frag_pos = vec3(model * vec4(in_position, 1.0));
-        }
-        """
+        return _FALLBACK_VERTEX_SHADER
 
     def _get_fallback_fragment_shader(self) -> str:
         """Basic fallback fragment shader for when main shaders can't be loaded."""
-        return """
-        #version 330 core
-        
-        in vec3 v_normal;
-        in vec3 frag_pos;
-        
-        uniform vec3 light_pos;
-        uniform vec3 view_pos;
-        uniform vec3 color;
-        
-        out vec4 frag_color;
-        
-        void main() {
-            // Simple diffuse lighting
-            vec3 norm = normalize(v_normal);
-            vec3 light_dir = normalize(light_pos - frag_pos);
-            float diff = max(dot(norm, light_dir), 0.0);
-            
-            // Simple ambient + diffuse
-            vec3 ambient = 0.3 * color;
-            vec3 diffuse = diff * color;
-            
-            frag_color = vec4(ambient + diffuse, 1.0);
-        }
-        """
+        return _FALLBACK_FRAGMENT_SHADER
     
     def _create_axis_arrows(self) -> list:
         axis_data = []
         for axis in ["X", "Y", "Z"]:
             mesh, transform, color = make_axis_arrow(axis)
             axis_mesh = Mesh(self.ctx, self.prog, mesh, f"axis_{axis}")
-            axis_data.append({"mesh": axis_mesh, "transform": transform, "color": color})
+            axis_data.append({
+                "mesh": axis_mesh,
+                "transform": transform,
+                "color": color,
+                # Arrow transforms are pure rotations; their normal matrix is static
+                "normal_transform": glm.mat3(transform),
+                # Scaled transform, refreshed only when the arrow scale changes
+                "scaled_transform": transform,
+            })
         return axis_data
 
+    def _write_transform(self, model_mat: glm.mat4, normal_matrix: glm.mat3):
+        """Upload the model and normal matrices to the transform uniform buffer in one write."""
+        # glm.mat4(mat3) pads each column to a vec4, matching the std140 mat3 layout
+        padded_normal = glm.mat4(normal_matrix).to_bytes()[:_NORMAL_MATRIX_STD140_SIZE]
+        self._transform_ubo.write(model_mat.to_bytes() + padded_normal)
+
+    def _draw_meshes(self, meshes: list, default_color: tuple, selected_color: tuple):
+        """Draw meshes grouped by colour so the colour uniform is set at most twice."""
+        object_color = self.prog['object_color']
+        selected = list(filter(_is_selected, meshes))
+        unselected = list(filterfalse(_is_selected, meshes))
+        
+        for color, group in ((default_color, unselected), (selected_color, selected)):
+            if not group:
+                continue
+            object_color.value = color
+            for mesh in group:
+                mesh.draw()
+
     def resize(self, width: int, height: int):
         if self.fbo:
             self.fbo.release()
@@ -125,70 +179,92 @@ class Renderer:
             depth_attachment=self.ctx.depth_texture((width, height))
         )
         self.texture = self.fbo.color_attachments[0]
+        self.invalidate()
 
+    def invalidate(self):
+        """Force the next render() call to redraw even if its inputs look unchanged."""
+        self._last_frame_key = None
 
     def render(self, scene: Scene, camera: ArcballCamera, view_options: dict):
-        self.fbo.use()
-        rendering_config = get_rendering_config()
-        self.ctx.clear(*rendering_config.BACKGROUND_COLOR)
+        rendering_config = _rendering_config
+        selected_color = rendering_config.SELECTED_MESH_COLOR
+        default_color = rendering_config.DEFAULT_MESH_COLOR
         
         view_mat = camera.get_view_matrix()
         proj_mat = camera.get_projection_matrix()
+        model_mat, normal_matrix = scene.get_model_matrix()
+        
+        # The texture still holds the previous frame, so redraw only when
+        # something that affects the image has changed
+        frame_key = (
+            view_mat, proj_mat, model_mat, scene.scale,
+            scene.content_version, len(scene.meshes),
+            view_options.get('wireframe', False), view_options.get('show_axes', True),
+            rendering_config.BACKGROUND_COLOR, default_color, selected_color,
+        )
+        if frame_key == self._last_frame_key:
+            return
+        self._last_frame_key = frame_key
+        
+        self.fbo.use()
+        self.ctx.clear(*rendering_config.BACKGROUND_COLOR)
+        
+        # Bound per frame: anything else using the binding point would
+        # otherwise silently replace the mesh transforms
+        self._transform_ubo.bind_to_uniform_block(_TRANSFORM_BINDING)
         
         self.prog['view'].write(view_mat)
         self.prog['projection'].write(proj_mat)
         self.prog['light_pos'].value = tuple(camera.position)
         self.prog['view_pos'].value = tuple(camera.position)
-
-        trans_mat = glm.translate(glm.mat4(1.0), scene.translation)
-        rot_mat = glm.mat4_cast(scene.rotation)
-        center_offset = glm.translate(glm.mat4(1.0), -scene.center)
-        model_mat = trans_mat * rot_mat * center_offset
         
         # Optimized rendering: batch meshes by render state to minimize state changes
         is_wireframe = view_options.get('wireframe', False)
         
         # Collect visible meshes
-        visible_meshes = [mesh for mesh in scene.meshes if mesh.visible]
+        visible_meshes = list(filter(_is_visible, scene.meshes))
         
         if visible_meshes:
-            self.prog['model'].write(model_mat)
-            # Calculate normal matrix on CPU for better performance
-            normal_matrix = glm.mat3(glm.transpose(glm.inverse(model_mat)))
-            self.prog['normal_matrix'].write(normal_matrix)
+            # Only re-upload the scene transform when it changed or was
+            # overwritten by the axis arrows last frame
+            if model_mat is not self._uploaded_model_mat:
+                self._write_transform(model_mat, normal_matrix)
+                self._uploaded_model_mat = model_mat
             
             if is_wireframe:
                 # Render all meshes in wireframe mode
                 self.ctx.wireframe = True
-                for mesh in visible_meshes:
-                    color = rendering_config.SELECTED_MESH_COLOR if mesh.selected else rendering_config.DEFAULT_MESH_COLOR
-                    mesh.render(color)
+                self._draw_meshes(visible_meshes, default_color, selected_color)
                 self.ctx.wireframe = False
             else:
                 # Render all meshes in solid mode (no state changes needed)
-                for mesh in visible_meshes:
-                    color = rendering_config.SELECTED_MESH_COLOR if mesh.selected else rendering_config.DEFAULT_MESH_COLOR
-                    mesh.render(color)
+                self._draw_meshes(visible_meshes, default_color, selected_color)
             
         # Render axis arrows, which should also be affected by the scene's transformations
         if view_options.get('show_axes', True):
             # Make arrows bigger relative to the mesh
             arrow_scale_factor = scene.scale * rendering_config.AXIS_SCALE_MULTIPLIER 
-            scale_mat = glm.scale(glm.mat4(1.0), glm.vec3(arrow_scale_factor))
+            if arrow_scale_factor != self._axis_scale_factor:
+                scale_mat = glm.scale(glm.mat4(1.0), glm.vec3(arrow_scale_factor))
+                for axis in self.axis_arrows:
+                    axis['scaled_transform'] = scale_mat * axis['transform']
+                self._axis_scale_factor = arrow_scale_factor
 
             for axis in self.axis_arrows:
-                axis_model_mat = model_mat * scale_mat * axis['transform']
-                self.prog['model'].write(axis_model_mat)
-                # Calculate normal matrix for each axis
-                axis_normal_matrix = glm.mat3(glm.transpose(glm.inverse(axis_model_mat)))
-                self.prog['normal_matrix'].write(axis_normal_matrix)
+                axis_model_mat = model_mat * axis['scaled_transform']
+                # Arrow transforms are rotations and the arrow scale is uniform
+                # (the shader renormalizes), so normals only need the rotations
+                axis_normal_matrix = normal_matrix * axis['normal_transform']
+                self._write_transform(axis_model_mat, axis_normal_matrix)
                 axis['mesh'].render(axis['color'])
+            self._uploaded_model_mat = None
 
         self.ctx.screen.use()
 
     def release(self):
         """Release all OpenGL resources."""
         self.prog.release()
+        self._transform_ubo.release()
         for axis in self.axis_arrows:
             axis['mesh'].release()
         self.fbo.release()
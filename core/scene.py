@@ -1,62 +1,287 @@
+import os
 import glm
 import numpy as np
 import trimesh
 from typing import List
 
-from .mesh import Mesh
+from .mesh import Mesh, PreparedMeshData
+
+# Shared result for scenes with nothing to bound; read-only so no caller can corrupt it
+_ZERO3 = np.zeros(3, dtype=np.float32)
+_ZERO3.setflags(write=False)
+
+# Default orientation and offset restored by reset_transformations()
+_ISOMETRIC_ROTATION = glm.quat(0.7071, 0.0, -0.7071, 0.0)
+_ZERO_TRANSLATION = glm.vec3(0.0, 0.0, 0.0)
+
 
 class Scene:
     """Manages all objects, transformations, and properties of the 3D scene."""
+    # Fixed attribute layout: faster attribute access on per-frame paths
+    __slots__ = (
+        "meshes", "_model_mat", "_normal_matrix", "_model_dirty",
+        "_mesh_bounds", "_mesh_visible", "_mesh_selected", "_mesh_count", "_selected_count",
+        "_bounds_min", "_bounds_max", "_bounds_cache", "_bounds_dirty", "_content_version",
+        "_selected_cache", "_selected_cache_version",
+        "_rotation", "_translation", "_center", "scale",
+    )
+
     def __init__(self):
         self.meshes: List[Mesh] = []
+        self._model_mat = glm.mat4(1.0)
+        self._normal_matrix = glm.mat3(1.0)
+        self._model_dirty = True
+        # Per-mesh (min, max) boxes pooled in `meshes` order, so the scene
+        # bounds are one reduction instead of a Python loop over meshes.
+        # Stored as float32 to match the GL-side vertex data. The arrays are
+        # over-allocated and grown geometrically; only the first
+        # `_mesh_count` rows are live
+        self._mesh_bounds = np.empty((0, 2, 3), dtype=np.float32)
+        self._mesh_visible = np.zeros(0, dtype=bool)
+        self._mesh_selected = np.zeros(0, dtype=bool)
+        self._mesh_count = 0
+        self._selected_count = 0
+        # Reduction targets reused by every recompute of the scene bounds
+        self._bounds_min = np.empty(3, dtype=np.float32)
+        self._bounds_max = np.empty(3, dtype=np.float32)
+        self._bounds_cache = None
+        self._bounds_dirty = True
+        # Bumped whenever meshes are added/removed or change visibility/selection
+        self._content_version = 0
+        # Selected meshes list, rebuilt only when the content version moves on
+        self._selected_cache: List[Mesh] = []
+        self._selected_cache_version = -1
         self.rotation = glm.quat(1.0, 0.0, 0.0, 0.0)  # Identity
         self.translation = glm.vec3(0.0, 0.0, 0.0)
         self.center = glm.vec3(0.0, 0.0, 0.0)
         self.scale = 1.0
 
+    # Transform properties mark the cached model matrix dirty on assignment
+    # (including augmented assignment such as `scene.translation += delta`)
+    @property
+    def rotation(self) -> glm.quat:
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, value: glm.quat):
+        self._rotation = value
+        self._model_dirty = True
+
+    @property
+    def translation(self) -> glm.vec3:
+        return self._translation
+
+    @translation.setter
+    def translation(self, value: glm.vec3):
+        self._translation = value
+        self._model_dirty = True
+
+    @property
+    def center(self) -> glm.vec3:
+        return self._center
+
+    @center.setter
+    def center(self, value: glm.vec3):
+        self._center = value
+        self._model_dirty = True
+
+    @property
+    def content_version(self) -> int:
+        """Counter that changes whenever the set of meshes or their visibility/selection changes."""
+        return self._content_version
+
+    def get_model_matrix(self) -> tuple[glm.mat4, glm.mat3]:
+        """Get the scene model matrix and its normal matrix, cached until the transform changes."""
+        if self._model_dirty:
+            trans_mat = glm.translate(glm.mat4(1.0), self._translation)
+            rot_mat = glm.mat4_cast(self._rotation)
+            center_offset = glm.translate(glm.mat4(1.0), -self._center)
+            self._model_mat = trans_mat * rot_mat * center_offset
+            # The model matrix is rotation + translations only, so its normal
+            # matrix is the rotation block itself - no inverse-transpose needed
+            self._normal_matrix = glm.mat3(rot_mat)
+            self._model_dirty = False
+        return self._model_mat, self._normal_matrix
+
     def add_mesh(self, ctx, prog, filepath: str):
         """Loads a mesh from file and adds it to the scene."""
         try:
             trimesh_mesh = trimesh.load(filepath)
-            name = trimesh_mesh.metadata.get('file_name', filepath.split('/')[-1])
+            name = trimesh_mesh.metadata.get('file_name') or os.path.basename(filepath)
             mesh = Mesh(ctx, prog, trimesh_mesh, name)
-            self.meshes.append(mesh)
+            self.append_mesh(mesh)
             return True, f"Loaded mesh: {name}"
         except Exception as e:
             return False, f"Failed to load mesh {filepath}: {e}"
             
-    def create_mesh(self, ctx, prog, trimesh_mesh, name: str):
-        """Creates a mesh from an already loaded trimesh object."""
-        try:
-            return Mesh(ctx, prog, trimesh_mesh, name)
-        except Exception as e:
-            return None
+    def create_mesh(self, ctx, prog, trimesh_mesh, name: str, prepared: PreparedMeshData = None):
+        """Creates a mesh from an already loaded trimesh object.
+
+        Pass the result of ``Mesh.prepare_buffers`` (e.g. computed on a worker
+        thread) as ``prepared`` to leave only the GL uploads to this call.
+
+        Raises:
+            ValueError: If the mesh data fails validation
+        """
+        return Mesh(ctx, prog, trimesh_mesh, name, prepared)
+
+    def create_meshes(self, ctx, prog, items) -> List[Mesh]:
+        """Creates several meshes that share one set of GL buffers.
+
+        ``items`` holds ``(trimesh_mesh, name, prepared)`` tuples; see
+        ``Mesh.create_batch``. The meshes are returned, not added to the scene.
+
+        Raises:
+            ValueError: If any mesh's data fails validation
+        """
+        return Mesh.create_batch(ctx, prog, items)
+
+    def append_mesh(self, mesh: Mesh):
+        """Adds an already created mesh to the scene."""
+        mesh.on_visibility_changed = self._on_mesh_visibility_changed
+        mesh.on_selection_changed = self._on_mesh_selection_changed
+        self.meshes.append(mesh)
+        count = self._mesh_count
+        self._reserve_mesh_state(count + 1)
+        self._mesh_bounds[count] = mesh.trimesh_mesh.bounds
+        self._mesh_visible[count] = mesh.visible
+        self._mesh_selected[count] = mesh.selected
+        self._selected_count += bool(mesh.selected)
+        self._mesh_count = count + 1
+        self._bounds_dirty = True
+        self._content_version += 1
+
+    def remove_mesh(self, index: int) -> Mesh:
+        """Removes the mesh at the given index and returns it; its resources are not released."""
+        index = range(len(self.meshes))[index]  # normalise negative indices
+        mesh = self.meshes.pop(index)
+        mesh.on_visibility_changed = None
+        mesh.on_selection_changed = None
+        # Shift the tail down in place to keep the rows in `meshes` order
+        count = self._mesh_count
+        self._selected_count -= bool(self._mesh_selected[index])
+        self._mesh_bounds[index:count - 1] = self._mesh_bounds[index + 1:count]
+        self._mesh_visible[index:count - 1] = self._mesh_visible[index + 1:count]
+        self._mesh_selected[index:count - 1] = self._mesh_selected[index + 1:count]
+        self._mesh_count = count - 1
+        self._bounds_dirty = True
+        self._content_version += 1
+        return mesh
 
     def clear(self):
         """Releases all mesh resources and clears the scene."""
         for mesh in self.meshes:
             mesh.release()
         self.meshes.clear()
+        self._mesh_count = 0
+        self._selected_count = 0
+        self._bounds_dirty = True
+        self._content_version += 1
         self.reset_transformations()
 
+    def mark_bounds_dirty(self):
+        """Force recalculation of the scene bounds on next access.
+
+        Call this after changing a mesh's geometry, or its visibility in a way
+        that bypasses ``Mesh.visible``, so the pooled per-mesh state is re-read.
+        """
+        self._sync_mesh_state()
+
+    def _on_mesh_visibility_changed(self, mesh: Mesh):
+        if self._mesh_count == len(self.meshes):
+            self._mesh_visible[self.meshes.index(mesh)] = mesh.visible
+        self._bounds_dirty = True
+        self._content_version += 1
+
+    def _on_mesh_selection_changed(self, mesh: Mesh):
+        if self._mesh_count == len(self.meshes):
+            self._mesh_selected[self.meshes.index(mesh)] = mesh.selected
+            self._selected_count += 1 if mesh.selected else -1
+        self._content_version += 1
+
+    @property
+    def selected_count(self) -> int:
+        """Number of selected meshes, maintained as selections change."""
+        if len(self.meshes) != self._mesh_count:
+            self._sync_mesh_state()
+        return self._selected_count
+
+    @property
+    def any_selected(self) -> bool:
+        """Whether at least one mesh is selected."""
+        return self.selected_count > 0
+
+    def get_selected_meshes(self) -> List[Mesh]:
+        """Get the selected meshes in scene order.
+
+        The list is cached and shared between callers until the scene content
+        changes, so treat it as read-only.
+        """
+        selected_count = self.selected_count  # syncs the pooled state if needed
+        if self._selected_cache_version != self._content_version:
+            meshes = self.meshes
+            self._selected_cache = ([meshes[i] for i in np.flatnonzero(self._mesh_selected[:self._mesh_count])]
+                                    if selected_count else [])
+            self._selected_cache_version = self._content_version
+        return self._selected_cache
+
     def get_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Get the bounding box of all visible meshes, cached until meshes change.
+
+        The returned arrays are reused between calls; copy them to keep a snapshot.
+        """
+        # The count check catches callers that edit `meshes` directly
+        if len(self.meshes) != self._mesh_count:
+            self._sync_mesh_state()
+        if self._bounds_dirty:
+            self._bounds_cache = self._compute_bounds()
+            self._bounds_dirty = False
+        return self._bounds_cache
+
+    def _reserve_mesh_state(self, capacity: int):
+        """Grows the pooled per-mesh arrays to hold at least `capacity` rows."""
+        if capacity <= len(self._mesh_visible):
+            return
+        # Double the capacity so a run of appends costs amortised O(1) each
+        new_capacity = max(8, 2 * len(self._mesh_visible), capacity)
+        count = self._mesh_count
+        mesh_bounds = np.empty((new_capacity, 2, 3), dtype=np.float32)
+        mesh_visible = np.zeros(new_capacity, dtype=bool)
+        mesh_selected = np.zeros(new_capacity, dtype=bool)
+        mesh_bounds[:count] = self._mesh_bounds[:count]
+        mesh_visible[:count] = self._mesh_visible[:count]
+        mesh_selected[:count] = self._mesh_selected[:count]
+        self._mesh_bounds = mesh_bounds
+        self._mesh_visible = mesh_visible
+        self._mesh_selected = mesh_selected
+
+    def _sync_mesh_state(self):
+        """Re-pools the per-mesh bounds, visibility and selection from the current mesh list."""
+        count = len(self.meshes)
+        self._reserve_mesh_state(count)
+        for i, mesh in enumerate(self.meshes):
+            self._mesh_bounds[i] = mesh.trimesh_mesh.bounds
+            self._mesh_visible[i] = mesh.visible
+            self._mesh_selected[i] = mesh.selected
+        self._mesh_count = count
+        self._selected_count = int(np.count_nonzero(self._mesh_selected[:count]))
+        self._bounds_dirty = True
+        self._content_version += 1
+
+    def _compute_bounds(self) -> tuple[np.ndarray, np.ndarray]:
         """Calculates the bounding box of all visible meshes."""
-        if not self.meshes:
-            return np.array([0, 0, 0]), np.array([0, 0, 0])
+        # Visibility is kept as a bool mask alongside the pooled bounds, so
+        # the visible boxes are gathered without touching the Mesh objects.
+        # One any() covers both the empty scene and the all-hidden case
+        count = self._mesh_count
+        visible = self._mesh_visible[:count]
+        if not visible.any():
+            return _ZERO3, _ZERO3
 
-        min_bounds = np.array([np.inf] * 3)
-        max_bounds = np.array([-np.inf] * 3)
-        
-        meshes_in_bounds = [m for m in self.meshes if m.visible]
-        if not meshes_in_bounds:
-            return np.array([0, 0, 0]), np.array([0, 0, 0])
-
-        for mesh in meshes_in_bounds:
-            bounds = mesh.trimesh_mesh.bounds
-            min_bounds = np.minimum(min_bounds, bounds[0])
-            max_bounds = np.maximum(max_bounds, bounds[1])
-        
-        return min_bounds, max_bounds
+        bounds = self._mesh_bounds[:count][visible]
+        bounds[:, 0].min(axis=0, out=self._bounds_min)
+        bounds[:, 1].max(axis=0, out=self._bounds_max)
+        return self._bounds_min, self._bounds_max
 
     def fit_to_view(self) -> float:
         """Calculates the center and scale needed to fit all meshes."""
@@ -64,10 +289,12 @@ class Scene:
             return 1.0
 
         min_bounds, max_bounds = self.get_bounds()
-        center_point = (min_bounds + max_bounds) / 2.0
-        size = np.max(max_bounds - min_bounds)
+        # Work on plain floats: three components do not warrant temporary arrays
+        min_x, min_y, min_z = min_bounds.tolist()
+        max_x, max_y, max_z = max_bounds.tolist()
+        size = max(max_x - min_x, max_y - min_y, max_z - min_z)
 
-        self.center = glm.vec3(*center_point)
+        self.center = glm.vec3((min_x + max_x) * 0.5, (min_y + max_y) * 0.5, (min_z + max_z) * 0.5)
         # Use a small epsilon to avoid a scale of zero for a single point
         self.scale = max(size, 1e-6) 
         
@@ -75,5 +302,7 @@ class Scene:
         return self.scale
         
     def reset_transformations(self):
-        self.rotation = glm.quat(0.7071, 0.0, -0.7071, 0.0)     #isometric view
-        self.translation = glm.vec3(0.0, 0.0, 0.0)
\ No newline at end of file
+        # Copy the constants: PyGLM's augmented assignment (`scene.translation += d`)
+        # mutates in place and would otherwise corrupt the shared defaults
+        self.rotation = glm.quat(_ISOMETRIC_ROTATION)     #isometric view
+        self.translation = glm.vec3(_ZERO_TRANSLATION)
\ No newline at end of file
@@ -6,10 +6,14 @@ in vec3 in_normal;
 out vec3 v_normal;
 out vec3 v_position;
 
-uniform mat4 model;
+// Per-draw transforms, uploaded together in one uniform buffer
+layout(std140) uniform Transform {
+    mat4 model;
+    mat3 normal_matrix;
+};
+
 uniform mat4 view;
 uniform mat4 projection;
-uniform mat3 normal_matrix;
 
 void main() {
     v_normal = normal_matrix * in_normal;
@@ -0,0 +1,129 @@
+"""
+Tests for the async task module.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from utils.async_task import AsyncTask, TaskManager, TaskStatus
+
+
+TIMEOUT = 5.0
+
+
+def wait_until_done(task):
+    """Block until the task's worker thread has finished."""
+    task.thread.join(TIMEOUT)
+    assert not task.thread.is_alive()
+
+
+class TestAsyncTaskEvents:
+    """Test that tasks signal their owner instead of being polled."""
+
+    def test_notify_on_result(self):
+        """Test that finishing a task signals once and update() completes it."""
+        events = []
+        task = AsyncTask("load", lambda **kwargs: 42, on_event=events.append)
+
+        task.start()
+        wait_until_done(task)
+
+        assert events == ["load"]
+        assert task.update()
+        assert task.status == TaskStatus.COMPLETED
+        assert task.result == 42
+
+    def test_notify_on_progress(self):
+        """Test that each progress report signals before the result does."""
+        def work(report_progress, is_canceled):
+            report_progress(0.5, "Halfway")
+            return None
+
+        events = []
+        task = AsyncTask("load", work, on_event=events.append)
+
+        task.start()
+        wait_until_done(task)
+
+        assert events == ["load", "load"]
+        task.update()
+        assert task.progress == 0.5
+
+    def test_notify_on_cancel(self):
+        """Test that cancel() signals so the cancellation is processed without polling."""
+        started = threading.Event()
+
+        def work(report_progress, is_canceled):
+            started.set()
+            while not is_canceled():
+                threading.Event().wait(0.001)
+            return None
+
+        events = []
+        task = AsyncTask("load", work, on_event=events.append)
+        task.start()
+        assert started.wait(TIMEOUT)
+
+        task.cancel()
+
+        assert events == ["load"]
+        wait_until_done(task)
+        assert task.update()
+        assert task.status == TaskStatus.CANCELED
+
+    def test_cancel_before_pool_start(self):
+        """Test that a pool task canceled before it ran is marked canceled."""
+        release = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Occupy the only worker so the task stays queued
+            executor.submit(release.wait, TIMEOUT)
+            task = AsyncTask("load", lambda **kwargs: None)
+            task.start_with_executor(executor)
+
+            task.cancel()
+
+            assert task.update()
+            assert task.status == TaskStatus.CANCELED
+            release.set()
+
+
+class TestTaskManager:
+    """Test event-driven task updates in the TaskManager."""
+
+    def setup_method(self):
+        self.manager = TaskManager(max_workers=1)
+
+    def teardown_method(self):
+        self.manager.shutdown()
+
+    def test_update_all_reports_completed_task(self):
+        """Test that a finished task is reported once and then stays quiet."""
+        task = self.manager.create_task("load", lambda **kwargs: "done")
+        assert self.manager.has_tasks()
+        assert task.on_complete is None
+
+        task.start()
+        wait_until_done(task)
+
+        assert self.manager.update_all() == ["load"]
+        assert task.status == TaskStatus.COMPLETED
+        assert self.manager.update_all() == []
+
+        self.manager.remove_task("load")
+        assert not self.manager.has_tasks()
+
+    def test_update_all_survives_failing_update(self):
+        """Test that a task whose update raises is failed and later tasks are still updated."""
+        broken = self.manager.create_task("broken", lambda **kwargs: None)
+        healthy = self.manager.create_task("healthy", lambda **kwargs: None)
+        for task in (broken, healthy):
+            task.start()
+            wait_until_done(task)
+
+        with patch.object(broken, "update", side_effect=RuntimeError("boom")):
+            changed = self.manager.update_all()
+
+        assert changed == ["broken", "healthy"]
+        assert broken.status == TaskStatus.FAILED
+        assert isinstance(broken.error, RuntimeError)
+        assert healthy.status == TaskStatus.COMPLETED
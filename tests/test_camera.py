@@ -93,6 +93,25 @@ class TestArcballCamera:
         length = glm.length(ray)
         assert abs(length - 1.0) < 1e-6
     
+    def test_screen_ray_matches_unproject(self):
+        """Test that the cached inverse view-projection matches glm.unProject."""
+        camera = ArcballCamera(800, 600)
+        camera.set_zoom(12.0)
+        
+        view = camera.get_view_matrix()
+        proj = camera.get_projection_matrix()
+        viewport = glm.vec4(0, 0, 800, 600)
+        p0 = glm.unProject(glm.vec3(120, 600 - 450, 0.0), view, proj, viewport)
+        p1 = glm.unProject(glm.vec3(120, 600 - 450, 1.0), view, proj, viewport)
+        expected = glm.normalize(p1 - p0)
+        
+        ray = camera.screen_ray(120, 450, 800, 600)
+        assert np.allclose(np.array(ray), np.array(expected), atol=1e-5)
+        
+        # Changing the viewport must invalidate the cached inverse
+        camera.set_viewport(400, 400)
+        assert camera._inv_view_proj is None
+    
     def test_view_direction(self):
         """Test view direction calculation."""
         camera = ArcballCamera(800, 600)
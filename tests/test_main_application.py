@@ -0,0 +1,87 @@
+"""
+Tests for the main application's frame-spread mesh uploads.
+"""
+
+import numpy as np
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import Mock
+from config import get_threading_config
+from core.mesh import PreparedMeshData
+from ui.main_application import MainApplication
+
+
+def make_result(name, nbytes):
+    """Create a queued load result whose prepared arrays total `nbytes` bytes."""
+    vertex_bytes = nbytes // 2
+    prepared = PreparedMeshData(
+        vertices=np.zeros(vertex_bytes, dtype=np.uint8),
+        normals=np.zeros(nbytes - vertex_bytes, dtype=np.uint8),
+        indices=np.zeros(0, dtype=np.int32),
+    )
+    return {"abs_path": f"/meshes/{name}", "mtime_ns": 1, "trimesh_mesh": Mock(),
+            "name": name, "prepared": prepared}
+
+
+def make_app(results, task_id="load_meshes_0"):
+    """Create an application with queued uploads and mocked GL, scene and overlay."""
+    app = MainApplication.__new__(MainApplication)
+    app.renderer = Mock()
+    app.scene = Mock()
+    app.scene.create_meshes.side_effect = lambda ctx, prog, items: [Mock() for _ in items]
+    app.camera = Mock()
+    app._reset_zoom_multiplier = 1.0
+    app.loaded_mesh_paths = {}
+    app._recent_meshes = Mock()
+    app.progress_overlay = SimpleNamespace(active_task_id=task_id, visible=True,
+                                           update=Mock(), hide=Mock())
+    app._gl_upload_queue = deque(results)
+    app._gl_upload_total = len(results)
+    app._gl_upload_reset_view = False
+    app._gl_upload_task_id = task_id
+    return app
+
+
+def uploaded_names(app):
+    """Names uploaded by the last create_meshes call."""
+    items = app.scene.create_meshes.call_args[0][2]
+    return [name for _, name, _ in items]
+
+
+class TestUploadBudget:
+    """Test the per-frame byte budget of _upload_pending_meshes."""
+
+    def test_stops_at_budget(self, monkeypatch):
+        """Test that a frame takes meshes until the next one would exceed the budget."""
+        monkeypatch.setattr(get_threading_config(), "MESH_UPLOAD_BYTES_PER_FRAME", 100)
+        app = make_app([make_result(name, 40) for name in ("a", "b", "c", "d")])
+
+        app._upload_pending_meshes()
+        assert uploaded_names(app) == ["a", "b"]
+
+        app._upload_pending_meshes()
+        assert uploaded_names(app) == ["c", "d"]
+        assert not app._gl_upload_queue
+
+    def test_takes_oversized_mesh_alone(self, monkeypatch):
+        """Test that a mesh larger than the budget still uploads, one per frame."""
+        monkeypatch.setattr(get_threading_config(), "MESH_UPLOAD_BYTES_PER_FRAME", 100)
+        app = make_app([make_result("huge", 500), make_result("small", 10)])
+
+        app._upload_pending_meshes()
+        assert uploaded_names(app) == ["huge"]
+        app.progress_overlay.update.assert_called_once_with(0.5)
+
+        app._upload_pending_meshes()
+        assert uploaded_names(app) == ["small"]
+        app.progress_overlay.hide.assert_called_once()
+
+    def test_newer_load_keeps_its_overlay(self):
+        """Test that finishing an older load's uploads leaves a newer load's overlay shown."""
+        app = make_app([make_result("a", 10)])
+        app.progress_overlay.active_task_id = "load_meshes_1"
+
+        app._upload_pending_meshes()
+
+        assert not app._gl_upload_queue
+        app.progress_overlay.hide.assert_not_called()
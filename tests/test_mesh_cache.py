@@ -0,0 +1,101 @@
+"""
+Tests for the on-disk mesh geometry cache.
+"""
+
+import os
+import numpy as np
+import trimesh
+from utils import mesh_cache
+
+
+class TestMeshCache:
+    """Test caching of parsed mesh geometry."""
+
+    def test_cache_hit_skips_parsing(self, temp_dir, cube_mesh, monkeypatch):
+        """Test that a second load of an unchanged file is served from the cache."""
+        path = str(temp_dir / "cube.stl")
+        cube_mesh.export(path)
+        cache_dir = str(temp_dir / "cache")
+
+        first = mesh_cache.get_or_load(path, cache_dir)
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("cached mesh was parsed again")
+        monkeypatch.setattr(mesh_cache.trimesh, "load", fail_load)
+        second = mesh_cache.get_or_load(path, cache_dir)
+
+        assert np.allclose(second.vertices, first.vertices)
+        assert np.array_equal(second.faces, first.faces)
+        assert second.metadata['file_name'] == "cube.stl"
+
+    def test_modified_file_changes_key(self, temp_dir, cube_mesh):
+        """Test that rewriting a file invalidates its cache key."""
+        path = str(temp_dir / "cube.stl")
+        cube_mesh.export(path)
+        key = mesh_cache.cache_key(path)
+
+        # Same size, so only the modification time tells the versions apart
+        trimesh.creation.box(extents=[2.0, 1.0, 1.0]).export(path)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert mesh_cache.cache_key(path) != key
+
+    def test_evict_removes_least_recently_used(self, temp_dir):
+        """Test that eviction deletes the oldest entries first."""
+        for i, name in enumerate(("old", "mid", "new")):
+            entry = temp_dir / f"{name}.npz"
+            entry.write_bytes(b"x" * 100)
+            os.utime(entry, ns=(i * 1_000_000_000, i * 1_000_000_000))
+
+        mesh_cache._evict(str(temp_dir), max_bytes=200)
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["mid.npz", "new.npz"]
+
+
+class TestRecentMeshCache:
+    """Test the in-memory cache of recently deleted meshes."""
+
+    def write_file(self, temp_dir, name):
+        """Create a file and return its path and modification time."""
+        path = temp_dir / name
+        path.write_bytes(b"mesh")
+        return str(path), os.stat(path).st_mtime_ns
+
+    def test_get_returns_unchanged_file_and_keeps_entry(self, temp_dir, cube_mesh):
+        """Test that a hit is served and survives until discarded (e.g. a canceled load)."""
+        path, mtime = self.write_file(temp_dir, "cube.stl")
+        cache = mesh_cache.RecentMeshCache(capacity=2)
+        cache.put(path, mtime, cube_mesh)
+
+        assert cache.get(path) == (mtime, cube_mesh)
+        assert cache.get(path) == (mtime, cube_mesh)
+
+        cache.discard(path)
+        assert cache.get(path) is None
+
+    def test_stale_entry_is_dropped(self, temp_dir, cube_mesh):
+        """Test that a file modified after loading is not served from memory."""
+        path, mtime = self.write_file(temp_dir, "cube.stl")
+        cache = mesh_cache.RecentMeshCache(capacity=2)
+        # Remembered with the mtime from load time, before the file was rewritten
+        cache.put(path, mtime, cube_mesh)
+        os.utime(path, ns=(mtime, mtime + 1_000_000))
+
+        assert cache.get(path) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, temp_dir, cube_mesh):
+        """Test that capacity is enforced by dropping the least recently used entry."""
+        entries = [self.write_file(temp_dir, f"{name}.stl") for name in ("a", "b", "c")]
+        cache = mesh_cache.RecentMeshCache(capacity=2)
+        cache.put(*entries[0], cube_mesh)
+        cache.put(*entries[1], cube_mesh)
+        # Using "a" makes "b" the least recently used
+        assert cache.get(entries[0][0]) is not None
+
+        cache.put(*entries[2], cube_mesh)
+
+        assert cache.get(entries[1][0]) is None
+        assert cache.get(entries[0][0]) is not None
+        assert cache.get(entries[2][0]) is not None
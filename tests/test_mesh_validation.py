@@ -5,7 +5,8 @@ Tests for mesh validation functionality.
 import pytest
 import numpy as np
 import trimesh
-from core.mesh import Mesh
+from unittest.mock import Mock
+from core.mesh import Mesh, _finite_min_max
 from utils.exceptions import ValidationError
 
 
@@ -128,4 +129,71 @@ class TestMeshValidation:
         # Verify it has reasonable properties
         assert len(cube_mesh.vertices) > 0
         assert len(cube_mesh.faces) > 0
-        assert len(cube_mesh.vertices) == len(cube_mesh.vertex_normals)
\ No newline at end of file
+        assert len(cube_mesh.vertices) == len(cube_mesh.vertex_normals)
+    
+    def test_finite_min_max_detects_invalid_values(self):
+        """Test the single-pass NaN/Inf detection used by validation."""
+        assert _finite_min_max(np.array([[-2.0, 0.0, 3.0]])) == (-2.0, 3.0)
+        assert _finite_min_max(np.array([[0.0, np.nan, 1.0]])) == (None, None)
+        assert _finite_min_max(np.array([[0.0, np.inf, 1.0]])) == (None, None)
+        assert _finite_min_max(np.array([[-np.inf, 0.0, 1.0]])) == (None, None)
+
+    def test_prepare_buffers_produces_gl_ready_arrays(self, cube_mesh):
+        """Test that CPU-side preparation yields contiguous float32/int32 arrays."""
+        prepared = Mesh.prepare_buffers(cube_mesh)
+        
+        assert prepared.vertices.dtype == np.float32
+        assert prepared.normals.dtype == np.float32
+        assert prepared.indices.dtype == np.int32
+        assert prepared.vertices.flags['C_CONTIGUOUS']
+        assert prepared.vertices.shape == prepared.normals.shape
+        assert prepared.indices.shape == cube_mesh.faces.shape
+    
+    def test_prepare_buffers_rejects_invalid_mesh(self):
+        """Test that preparation runs the same validation as the constructor."""
+        with pytest.raises(ValueError):
+            Mesh.prepare_buffers(None)
+
+
+class TestMeshBatch:
+    """Test meshes that share one set of GL buffers."""
+    
+    def test_batch_offsets_indices_and_shares_buffers(self, simple_triangle_mesh, cube_mesh):
+        """Test that batched meshes draw their own index ranges from shared buffers."""
+        ctx = Mock()
+        meshes = Mesh.create_batch(ctx, Mock(), [
+            (simple_triangle_mesh, "triangle", None),
+            (cube_mesh, "cube", None),
+        ])
+        
+        # One upload each for positions, normals and indices
+        assert ctx.buffer.call_count == 3
+        indices = ctx.buffer.call_args_list[2][0][0]
+        assert np.array_equal(indices[:3], [0, 1, 2])
+        assert np.array_equal(indices[3:], cube_mesh.faces.reshape(-1) + 3)
+        
+        triangle, cube = meshes
+        assert (triangle._index_first, triangle._index_count) == (0, 3)
+        assert (cube._index_first, cube._index_count) == (3, cube_mesh.faces.size)
+        assert triangle.ibo is cube.ibo
+    
+    def test_shared_buffers_released_with_last_mesh(self, simple_triangle_mesh, cube_mesh):
+        """Test that shared buffers outlive all but the last mesh using them."""
+        # Distinct mocks per GL object, so each release is counted separately
+        ctx = Mock()
+        ctx.buffer.side_effect = lambda *args, **kwargs: Mock()
+        ctx.vertex_array.side_effect = lambda *args, **kwargs: Mock()
+        first, second = Mesh.create_batch(ctx, Mock(), [
+            (simple_triangle_mesh, "triangle", None),
+            (cube_mesh, "cube", None),
+        ])
+        
+        first.release()
+        first.vao.release.assert_called_once()
+        second.ibo.release.assert_not_called()
+        
+        second.release()
+        second.vao.release.assert_called_once()
+        second.ibo.release.assert_called_once()
+        second.vbo_pos.release.assert_called_once()
+        second.vbo_nrm.release.assert_called_once()
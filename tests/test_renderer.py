@@ -0,0 +1,79 @@
+"""
+Tests for the renderer's unchanged-frame skip.
+"""
+
+import trimesh
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
+from core.camera import ArcballCamera
+from core.renderer import Renderer
+from core.scene import Scene
+
+
+VIEW_OPTIONS = {'wireframe': False, 'show_axes': False}
+
+
+def make_renderer():
+    """Create a renderer with mocked GL objects (no OpenGL context needed)."""
+    renderer = Renderer.__new__(Renderer)
+    renderer.logger = Mock()
+    renderer.ctx = Mock()
+    renderer.prog = MagicMock()
+    renderer.fbo = Mock()
+    renderer.texture = Mock()
+    renderer._transform_ubo = Mock()
+    renderer.axis_arrows = []
+    renderer._uploaded_model_mat = None
+    renderer._axis_scale_factor = None
+    renderer._last_frame_key = None
+    return renderer
+
+
+def make_mesh():
+    """Create a lightweight stand-in for core.mesh.Mesh."""
+    return SimpleNamespace(trimesh_mesh=trimesh.creation.box(), visible=True, selected=False,
+                           on_visibility_changed=None, on_selection_changed=None, draw=Mock())
+
+
+class TestFrameSkip:
+    """Test that redraws happen exactly when the image inputs change."""
+
+    def setup_method(self):
+        self.renderer = make_renderer()
+        self.scene = Scene()
+        self.camera = ArcballCamera(800, 600)
+
+    def render_count(self):
+        """Render a frame and return how many frames have been drawn so far."""
+        self.renderer.render(self.scene, self.camera, VIEW_OPTIONS)
+        return self.renderer.fbo.use.call_count
+
+    def test_unchanged_frame_is_skipped(self):
+        """Test that an identical second frame does not touch the framebuffer."""
+        assert self.render_count() == 1
+        assert self.render_count() == 1
+
+    def test_scene_changes_invalidate_frame_key(self):
+        """Test that adding, selecting and removing meshes each force a redraw."""
+        mesh = make_mesh()
+        drawn = self.render_count()
+
+        self.scene.append_mesh(mesh)
+        assert self.render_count() == drawn + 1
+
+        # core.mesh.Mesh invokes this from its `selected` setter
+        mesh.selected = True
+        mesh.on_selection_changed(mesh)
+        assert self.render_count() == drawn + 2
+
+        self.scene.remove_mesh(0)
+        assert self.render_count() == drawn + 3
+        assert self.render_count() == drawn + 3
+
+    def test_invalidate_forces_redraw(self):
+        """Test that invalidate() redraws an otherwise unchanged frame."""
+        drawn = self.render_count()
+
+        self.renderer.invalidate()
+
+        assert self.render_count() == drawn + 1
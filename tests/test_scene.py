@@ -0,0 +1,180 @@
+"""
+Tests for the scene module.
+"""
+
+import pytest
+import glm
+import numpy as np
+import trimesh
+from types import SimpleNamespace
+from core.scene import Scene
+
+
+def make_mesh(center, extents=(1.0, 1.0, 1.0), visible=True, selected=False):
+    """Create a lightweight stand-in for core.mesh.Mesh (no OpenGL needed)."""
+    box = trimesh.creation.box(extents=extents)
+    box.apply_translation(center)
+    return SimpleNamespace(trimesh_mesh=box, visible=visible, selected=selected,
+                           on_visibility_changed=None, on_selection_changed=None)
+
+
+class TestSceneTransform:
+    """Test the cached scene model matrix."""
+
+    def test_model_matrix_cached(self):
+        """Test that the model matrix is reused while the transform is unchanged."""
+        scene = Scene()
+
+        model1, normal1 = scene.get_model_matrix()
+        model2, normal2 = scene.get_model_matrix()
+
+        assert model1 is model2
+        assert normal1 is normal2
+
+    def test_translation_invalidates_model_matrix(self):
+        """Test that augmented assignment on translation marks the matrix dirty."""
+        scene = Scene()
+        model1, _ = scene.get_model_matrix()
+
+        scene.translation += glm.vec3(1.0, 0.0, 0.0)
+        model2, _ = scene.get_model_matrix()
+
+        assert model1 is not model2
+        assert np.allclose(np.array(model2[3])[:3], [1.0, 0.0, 0.0])
+
+    def test_normal_matrix_matches_inverse_transpose(self):
+        """Test that the rotation-only normal matrix equals the inverse-transpose."""
+        scene = Scene()
+        scene.rotation = glm.angleAxis(glm.radians(30.0), glm.normalize(glm.vec3(1, 2, 3)))
+        scene.translation = glm.vec3(1.0, -2.0, 3.0)
+        scene.center = glm.vec3(0.5, 0.5, 0.5)
+
+        model, normal = scene.get_model_matrix()
+        expected = glm.mat3(glm.transpose(glm.inverse(model)))
+
+        assert np.allclose(np.array(normal), np.array(expected), atol=1e-5)
+
+
+class TestSceneBounds:
+    """Test scene bounding box computation."""
+
+    def test_empty_scene_bounds(self):
+        """Test that an empty scene reports zero bounds."""
+        scene = Scene()
+        min_bounds, max_bounds = scene.get_bounds()
+
+        assert np.allclose(min_bounds, 0.0)
+        assert np.allclose(max_bounds, 0.0)
+
+    def test_bounds_cover_visible_meshes(self):
+        """Test that bounds cover visible meshes and ignore hidden ones."""
+        scene = Scene()
+        scene.append_mesh(make_mesh((0.0, 0.0, 0.0)))
+        scene.append_mesh(make_mesh((4.0, 0.0, 0.0)))
+        scene.append_mesh(make_mesh((0.0, 0.0, -10.0), visible=False))
+
+        min_bounds, max_bounds = scene.get_bounds()
+
+        assert np.allclose(min_bounds, [-0.5, -0.5, -0.5])
+        assert np.allclose(max_bounds, [4.5, 0.5, 0.5])
+
+    def test_fit_to_view(self):
+        """Test that fit_to_view centers on the bounds and scales to the largest extent."""
+        scene = Scene()
+        scene.append_mesh(make_mesh((2.0, 0.0, 0.0), extents=(2.0, 4.0, 1.0)))
+
+        scale = scene.fit_to_view()
+
+        assert scale == pytest.approx(4.0)
+        assert np.allclose(np.array(scene.center), [2.0, 0.0, 0.0])
+
+    def test_bounds_cached_until_dirty(self):
+        """Test that bounds are cached and recomputed after invalidation."""
+        scene = Scene()
+        mesh = make_mesh((0.0, 0.0, 0.0))
+        scene.append_mesh(mesh)
+
+        bounds1 = scene.get_bounds()
+        assert scene.get_bounds() is bounds1
+
+        # Hiding the only mesh and invalidating must drop it from the bounds
+        mesh.visible = False
+        scene.mark_bounds_dirty()
+        min_bounds, max_bounds = scene.get_bounds()
+        assert np.allclose(min_bounds, 0.0)
+        assert np.allclose(max_bounds, 0.0)
+
+    def test_remove_mesh_invalidates_bounds(self):
+        """Test that removing a mesh updates the bounds."""
+        scene = Scene()
+        scene.append_mesh(make_mesh((0.0, 0.0, 0.0)))
+        scene.append_mesh(make_mesh((4.0, 0.0, 0.0)))
+        scene.get_bounds()
+
+        scene.remove_mesh(1)
+        _, max_bounds = scene.get_bounds()
+
+        assert np.allclose(max_bounds, [0.5, 0.5, 0.5])
+
+    def test_bounds_pool_grows_and_shrinks(self):
+        """Test that pooled bounds stay aligned with meshes across growth and removal."""
+        scene = Scene()
+        for i in range(10):
+            scene.append_mesh(make_mesh((float(i), 0.0, 0.0)))
+
+        scene.remove_mesh(0)
+        scene.remove_mesh(-1)
+        min_bounds, max_bounds = scene.get_bounds()
+
+        assert np.allclose(min_bounds, [0.5, -0.5, -0.5])
+        assert np.allclose(max_bounds, [8.5, 0.5, 0.5])
+
+
+class TestSceneSelection:
+    """Test the scene-maintained selection state."""
+
+    def test_selection_tracked_across_add_and_remove(self):
+        """Test that selected meshes are counted and listed in scene order."""
+        scene = Scene()
+        first = make_mesh((0.0, 0.0, 0.0), selected=True)
+        second = make_mesh((1.0, 0.0, 0.0))
+        third = make_mesh((2.0, 0.0, 0.0), selected=True)
+        for mesh in (first, second, third):
+            scene.append_mesh(mesh)
+
+        assert scene.selected_count == 2
+        assert scene.get_selected_meshes() == [first, third]
+
+        scene.remove_mesh(0)
+
+        assert scene.any_selected
+        assert scene.get_selected_meshes() == [third]
+
+    def test_selection_callback_updates_count(self):
+        """Test that the mesh selection callback keeps the count in sync."""
+        scene = Scene()
+        mesh = make_mesh((0.0, 0.0, 0.0))
+        scene.append_mesh(mesh)
+        assert not scene.any_selected
+
+        # core.mesh.Mesh invokes this from its `selected` setter
+        mesh.selected = True
+        mesh.on_selection_changed(mesh)
+
+        assert scene.selected_count == 1
+
+    def test_selected_meshes_cached_until_selection_changes(self):
+        """Test that the selected list is shared between calls and rebuilt on change."""
+        scene = Scene()
+        first = make_mesh((0.0, 0.0, 0.0), selected=True)
+        second = make_mesh((1.0, 0.0, 0.0))
+        scene.append_mesh(first)
+        scene.append_mesh(second)
+
+        selected = scene.get_selected_meshes()
+        assert scene.get_selected_meshes() is selected
+
+        second.selected = True
+        second.on_selection_changed(second)
+
+        assert scene.get_selected_meshes() == [first, second]
@@ -5,11 +5,24 @@ This module contains the ControlsPanelComponent class that handles the main
 control interface including buttons, options, and mesh management.
 """
 
+from operator import attrgetter
 from typing import List, Callable, Optional, Dict, Any, Set
 from imgui_bundle import imgui, icons_fontawesome_6, hello_imgui
 from .base_component import BaseUIComponent
 from core.scene import Scene
 
+_is_selected = attrgetter('selected')
+_is_visible = attrgetter('visible')
+
+# Widget labels, built once instead of formatted every frame
+_LOAD_LABEL = f"{icons_fontawesome_6.ICON_FA_FOLDER_OPEN} Load Mesh..."
+_DELETE_LABEL = f"{icons_fontawesome_6.ICON_FA_TRASH} Delete Selected"
+_RESET_LABEL = f"{icons_fontawesome_6.ICON_FA_ARROWS_ROTATE} Reset View"
+_MESH_ICON_LABEL = icons_fontawesome_6.ICON_FA_CUBE + " "
+_SELECTED_ICON_COLOR = imgui.ImVec4(0.4, 0.7, 1.0, 1.0)
+# Full-width, auto-height button size shared by the action buttons
+_BUTTON_SIZE_FILL = imgui.ImVec2(-1, 0)
+
 
 class ControlsPanelComponent(BaseUIComponent):
     """
@@ -32,6 +45,8 @@ class ControlsPanelComponent(BaseUIComponent):
         super().__init__("ControlsPanel")
         self.scene = scene
         self.font_title = None
+        # Heading renderer, rebound by set_title_font so the font is not re-checked per frame
+        self._render_heading = self._render_heading_plain
         
         # Callbacks - will be injected by the main application
         self._load_callback: Optional[Callable] = None
@@ -40,6 +55,12 @@ class ControlsPanelComponent(BaseUIComponent):
         
         # View options - will be injected by the main application
         self._view_options: Dict[str, Any] = {'wireframe': False, 'show_axes': True}
+        # Bumped whenever the user toggles a view option, so changes can be
+        # detected without comparing dictionaries every frame
+        self.view_options_version = 0
+        
+        # Hidden checkbox IDs per list row ("##vis_0", ...), grown on demand
+        self._visibility_ids: List[str] = []
         
     def render(self) -> None:
         """Render the controls panel with all UI elements."""
@@ -47,7 +68,7 @@ class ControlsPanelComponent(BaseUIComponent):
             return
             
         try:
-            self._render_title()
+            self._render_heading("Controls")
             self._render_action_buttons()
             self._render_view_options()
             self._render_mesh_list()
@@ -55,22 +76,22 @@ class ControlsPanelComponent(BaseUIComponent):
         except Exception as e:
             self.handle_error(e, "controls panel rendering")
             
-    def _render_title(self) -> None:
-        """Render the panel title with styling."""
-        if self.font_title:
-            imgui.push_font(self.font_title)
-        imgui.text("Controls")
-        if self.font_title:
-            imgui.pop_font()
+    def _render_heading_plain(self, text: str) -> None:
+        """Render a section heading in the default font."""
+        imgui.text(text)
+        imgui.separator()
+        
+    def _render_heading_with_font(self, text: str) -> None:
+        """Render a section heading in the title font."""
+        imgui.push_font(self.font_title)
+        imgui.text(text)
+        imgui.pop_font()
         imgui.separator()
         
     def _render_action_buttons(self) -> None:
         """Render the main action buttons (Load, Delete, Reset)."""
         # Load Mesh button
-        if imgui.button(
-            f"{icons_fontawesome_6.ICON_FA_FOLDER_OPEN} Load Mesh...", 
-            imgui.ImVec2(-1, 0)
-        ):
+        if imgui.button(_LOAD_LABEL, _BUTTON_SIZE_FILL):
             if self._load_callback:
                 try:
                     self._load_callback()
@@ -79,15 +100,12 @@ class ControlsPanelComponent(BaseUIComponent):
                     self.handle_error(e, "load mesh callback")
                     
         # Delete Selected button
-        has_selected = any(mesh.selected for mesh in self.scene.meshes)
+        has_selected = self.scene.any_selected
         
         if not has_selected:
             imgui.push_style_var(imgui.StyleVar_.alpha, 0.5)
             
-        button_clicked = imgui.button(
-            f"{icons_fontawesome_6.ICON_FA_TRASH} Delete Selected", 
-            imgui.ImVec2(-1, 0)
-        )
+        button_clicked = imgui.button(_DELETE_LABEL, _BUTTON_SIZE_FILL)
         
         if not has_selected:
             imgui.pop_style_var()
@@ -101,10 +119,7 @@ class ControlsPanelComponent(BaseUIComponent):
                     self.handle_error(e, "delete selected callback")
                     
         # Reset View button
-        if imgui.button(
-            f"{icons_fontawesome_6.ICON_FA_ARROWS_ROTATE} Reset View", 
-            imgui.ImVec2(-1, 0)
-        ):
+        if imgui.button(_RESET_LABEL, _BUTTON_SIZE_FILL):
             if self._reset_callback:
                 try:
                     self._reset_callback()
@@ -118,33 +133,39 @@ class ControlsPanelComponent(BaseUIComponent):
         _, new_wireframe = imgui.checkbox("Wireframe", self._view_options['wireframe'])
         if new_wireframe != self._view_options['wireframe']:
             self._view_options['wireframe'] = new_wireframe
-            self.logger.debug(f"Wireframe mode: {new_wireframe}")
+            self.view_options_version += 1
+            self.logger.debug("Wireframe mode: %s", new_wireframe)
             
         # Show Axes checkbox
         _, new_show_axes = imgui.checkbox("Show Axes", self._view_options['show_axes'])
         if new_show_axes != self._view_options['show_axes']:
             self._view_options['show_axes'] = new_show_axes
-            self.logger.debug(f"Show axes: {new_show_axes}")
+            self.view_options_version += 1
+            self.logger.debug("Show axes: %s", new_show_axes)
             
         imgui.separator()
         
     def _render_mesh_list(self) -> None:
         """Render the list of loaded meshes with controls."""
-        # Mesh list title
-        if self.font_title:
-            imgui.push_font(self.font_title)
-        imgui.text("Meshes")
-        if self.font_title:
-            imgui.pop_font()
-        imgui.separator()
+        self._render_heading("Meshes")
         
         if not self.scene.meshes:
             imgui.text("No meshes loaded.")
             return
             
-        # Render each mesh in the list
-        for i, mesh in enumerate(self.scene.meshes):
-            self._render_mesh_item(i, mesh)
+        # Only submit the rows that are scrolled into view; every row has
+        # the same height, which is what the clipper relies on
+        meshes = self.scene.meshes
+        visibility_ids = self._visibility_ids
+        if len(visibility_ids) < len(meshes):
+            visibility_ids.extend(f"##vis_{i}" for i in range(len(visibility_ids), len(meshes)))
+            
+        clipper = imgui.ListClipper()
+        clipper.begin(len(meshes))
+        while clipper.step():
+            for i in range(clipper.display_start, clipper.display_end):
+                self._render_mesh_item(i, meshes[i])
+        clipper.end()
             
     def _render_mesh_item(self, index: int, mesh) -> None:
         """
@@ -156,25 +177,24 @@ class ControlsPanelComponent(BaseUIComponent):
         """
         try:
             # Visibility checkbox
-            clicked, mesh.visible = imgui.checkbox(f"##vis_{index}", mesh.visible)
+            clicked, mesh.visible = imgui.checkbox(self._visibility_ids[index], mesh.visible)
             if clicked:
-                self.logger.debug(f"Mesh '{mesh.name}' visibility: {mesh.visible}")
+                self.logger.debug("Mesh '%s' visibility: %s", mesh.name, mesh.visible)
                 
             imgui.same_line()
             
             # Mesh icon with selection-based coloring
-            icon = icons_fontawesome_6.ICON_FA_CUBE
             if mesh.selected:
-                imgui.text_colored(imgui.ImVec4(0.4, 0.7, 1.0, 1.0), icon + " ")
+                imgui.text_colored(_SELECTED_ICON_COLOR, _MESH_ICON_LABEL)
             else:
-                imgui.text(icon + " ")
+                imgui.text(_MESH_ICON_LABEL)
                 
             imgui.same_line()
             
             # Selectable mesh name
-            clicked, mesh.selected = imgui.selectable(f"{mesh.name}", mesh.selected)
+            clicked, mesh.selected = imgui.selectable(mesh.name, mesh.selected)
             if clicked:
-                self.logger.debug(f"Mesh '{mesh.name}' selected: {mesh.selected}")
+                self.logger.debug("Mesh '%s' selected: %s", mesh.name, mesh.selected)
                 
         except Exception as e:
             self.handle_error(e, f"rendering mesh item {index}")
@@ -220,6 +240,8 @@ class ControlsPanelComponent(BaseUIComponent):
             font: The ImGui font object to use for titles
         """
         self.font_title = font
+        self._render_heading = (self._render_heading_with_font if font
+                                else self._render_heading_plain)
         
     def get_selected_mesh_count(self) -> int:
         """
@@ -228,7 +250,7 @@ class ControlsPanelComponent(BaseUIComponent):
         Returns:
             Number of selected meshes
         """
-        return sum(1 for mesh in self.scene.meshes if mesh.selected)
+        return sum(map(_is_selected, self.scene.meshes))
         
     def get_visible_mesh_count(self) -> int:
         """
@@ -237,4 +259,4 @@ class ControlsPanelComponent(BaseUIComponent):
         Returns:
             Number of visible meshes
         """
-        return sum(1 for mesh in self.scene.meshes if mesh.visible)
\ No newline at end of file
+        return sum(map(_is_visible, self.scene.meshes))
\ No newline at end of file
@@ -5,11 +5,17 @@ This module contains the InfoPanelComponent class that displays information
 about selected meshes including statistics and properties.
 """
 
+from operator import attrgetter
 from typing import List, Optional
 from imgui_bundle import imgui
 from .base_component import BaseUIComponent
 from core.scene import Scene
 
+_is_selected = attrgetter('selected')
+
+_VISIBLE_YES = "Visible: Yes"
+_VISIBLE_NO = "Visible: No"
+
 
 class InfoPanelComponent(BaseUIComponent):
     """
@@ -31,6 +37,13 @@ class InfoPanelComponent(BaseUIComponent):
         super().__init__("InfoPanel")
         self.scene = scene
         self.font_title = None
+        # Title renderer, rebound by set_title_font so the font is not re-checked per frame
+        self._render_title = self._render_title_plain
+        
+        # Selection summary text, rebuilt only when the scene content changes
+        self._summary_version = None
+        self._summary_header = ""
+        self._summary_totals = ""
         
     def render(self) -> None:
         """Render the info panel with mesh information."""
@@ -44,28 +57,58 @@ class InfoPanelComponent(BaseUIComponent):
         except Exception as e:
             self.handle_error(e, "info panel rendering")
             
-    def _render_title(self) -> None:
-        """Render the panel title with styling."""
-        if self.font_title:
-            imgui.push_font(self.font_title)
+    def _render_title_plain(self) -> None:
+        """Render the panel title in the default font."""
+        imgui.text("Info")
+        imgui.separator()
+        
+    def _render_title_with_font(self) -> None:
+        """Render the panel title in the title font."""
+        imgui.push_font(self.font_title)
         imgui.text("Info")
-        if self.font_title:
-            imgui.pop_font()
+        imgui.pop_font()
         imgui.separator()
         
     def _render_mesh_info(self) -> None:
         """Render information about selected meshes."""
-        selected_meshes = self._get_selected_meshes()
+        selected_meshes = self.scene.get_selected_meshes()
         
         if not selected_meshes:
             imgui.text("No mesh selected.")
             return
             
+        version = self.scene.content_version
+        if version != self._summary_version:
+            self._update_summary(selected_meshes)
+            self._summary_version = version
+            
         if len(selected_meshes) == 1:
             self._render_single_mesh_info(selected_meshes[0])
         else:
             self._render_multiple_mesh_info(selected_meshes)
             
+    def _update_summary(self, selected_meshes: List) -> None:
+        """
+        Format the selection header and totals shown above the mesh details.
+        
+        Args:
+            selected_meshes: List of selected mesh objects
+        """
+        if len(selected_meshes) == 1:
+            self._summary_header = f"Selected: {selected_meshes[0].name}"
+            self._summary_totals = ""
+            return
+            
+        total_vertices = 0
+        total_faces = 0
+        for mesh in selected_meshes:
+            stats = mesh.stats
+            total_vertices += stats.vertex_count
+            total_faces += stats.face_count
+            
+        self._summary_header = f"Selected: {len(selected_meshes)} meshes"
+        self._summary_totals = f"Total Vertices: {total_vertices:,}\nTotal Faces: {total_faces:,}"
+            
     def _get_selected_meshes(self) -> List:
         """
         Get the list of currently selected meshes.
@@ -73,11 +116,7 @@ class InfoPanelComponent(BaseUIComponent):
         Returns:
             List of selected mesh objects
         """
-        try:
-            return [mesh for mesh in self.scene.meshes if mesh.selected]
-        except Exception as e:
-            self.handle_error(e, "getting selected meshes")
-            return []
+        return list(filter(_is_selected, self.scene.meshes))
             
     def _render_single_mesh_info(self, mesh) -> None:
         """
@@ -88,35 +127,21 @@ class InfoPanelComponent(BaseUIComponent):
         """
         try:
             # Mesh name as header
-            imgui.text(f"Selected: {mesh.name}")
+            imgui.text_unformatted(self._summary_header)
             imgui.separator()
             
-            # Basic statistics
-            if hasattr(mesh, 'trimesh_mesh') and mesh.trimesh_mesh is not None:
-                vertex_count = len(mesh.trimesh_mesh.vertices)
-                face_count = len(mesh.trimesh_mesh.faces)
-                
-                imgui.text(f"Vertices: {vertex_count:,}")
-                imgui.text(f"Faces: {face_count:,}")
-                
-                # Additional properties if available
-                if hasattr(mesh.trimesh_mesh, 'bounds'):
-                    bounds = mesh.trimesh_mesh.bounds
-                    size = bounds[1] - bounds[0]
-                    
-                    imgui.separator()
-                    imgui.text("Bounding Box:")
-                    imgui.text(f"  Size: {size[0]:.3f} × {size[1]:.3f} × {size[2]:.3f}")
-                    
-                if hasattr(mesh.trimesh_mesh, 'area'):
-                    imgui.text(f"Surface Area: {mesh.trimesh_mesh.area:.3f}")
-                    
-                if hasattr(mesh.trimesh_mesh, 'volume') and mesh.trimesh_mesh.volume > 0:
-                    imgui.text(f"Volume: {mesh.trimesh_mesh.volume:.3f}")
+            # Basic statistics, computed once per mesh rather than every frame.
+            # Mesh construction guarantees trimesh data, and stats resolves the
+            # optional attributes once, so no per-frame hasattr checks are needed
+            stats = mesh.stats
+            imgui.text_unformatted(stats.count_text)
+            
+            imgui.separator()
+            imgui.text_unformatted(stats.measure_text)
                     
             # Visibility and selection status
             imgui.separator()
-            imgui.text(f"Visible: {'Yes' if mesh.visible else 'No'}")
+            imgui.text_unformatted(_VISIBLE_YES if mesh.visible else _VISIBLE_NO)
             
         except Exception as e:
             self.handle_error(e, f"rendering single mesh info for {getattr(mesh, 'name', 'unknown')}")
@@ -130,28 +155,22 @@ class InfoPanelComponent(BaseUIComponent):
             selected_meshes: List of selected mesh objects
         """
         try:
-            imgui.text(f"Selected: {len(selected_meshes)} meshes")
+            imgui.text_unformatted(self._summary_header)
             imgui.separator()
             
             # Summary statistics
-            total_vertices = 0
-            total_faces = 0
-            
-            for mesh in selected_meshes:
-                if hasattr(mesh, 'trimesh_mesh') and mesh.trimesh_mesh is not None:
-                    total_vertices += len(mesh.trimesh_mesh.vertices)
-                    total_faces += len(mesh.trimesh_mesh.faces)
-                    
-            imgui.text(f"Total Vertices: {total_vertices:,}")
-            imgui.text(f"Total Faces: {total_faces:,}")
+            imgui.text_unformatted(self._summary_totals)
             
             imgui.separator()
             
             # Individual mesh details in tree nodes
             for mesh in selected_meshes:
                 if imgui.tree_node(f"{mesh.name}"):
-                    self._render_mesh_tree_details(mesh)
-                    imgui.tree_pop()
+                    # Pop even if the details fail so the ImGui ID stack stays balanced
+                    try:
+                        self._render_mesh_tree_details(mesh)
+                    finally:
+                        imgui.tree_pop()
                     
         except Exception as e:
             self.handle_error(e, "rendering multiple mesh info")
@@ -164,20 +183,8 @@ class InfoPanelComponent(BaseUIComponent):
         Args:
             mesh: The mesh object to display details for
         """
-        try:
-            if hasattr(mesh, 'trimesh_mesh') and mesh.trimesh_mesh is not None:
-                vertex_count = len(mesh.trimesh_mesh.vertices)
-                face_count = len(mesh.trimesh_mesh.faces)
-                
-                imgui.text(f"Vertices: {vertex_count:,}")
-                imgui.text(f"Faces: {face_count:,}")
-                imgui.text(f"Visible: {'Yes' if mesh.visible else 'No'}")
-            else:
-                imgui.text("No mesh data available")
-                
-        except Exception as e:
-            self.handle_error(e, f"rendering mesh tree details for {getattr(mesh, 'name', 'unknown')}")
-            imgui.text("Error displaying mesh details")
+        imgui.text_unformatted(mesh.stats.count_text)
+        imgui.text_unformatted(_VISIBLE_YES if mesh.visible else _VISIBLE_NO)
             
     def set_title_font(self, font) -> None:
         """
@@ -187,6 +194,8 @@ class InfoPanelComponent(BaseUIComponent):
             font: The ImGui font object to use for titles
         """
         self.font_title = font
+        self._render_title = (self._render_title_with_font if font
+                              else self._render_title_plain)
         
     def get_selected_count(self) -> int:
         """
@@ -31,6 +31,9 @@ class MenuBarComponent(BaseUIComponent):
         
         # View options - will be injected by the main application
         self._view_options = {'wireframe': False, 'show_axes': True}
+        # Bumped whenever the user toggles a view option, so changes can be
+        # detected without comparing dictionaries every frame
+        self.view_options_version = 0
         
     def render(self) -> None:
         """Render the menu bar with File and View menus."""
@@ -83,7 +86,8 @@ class MenuBarComponent(BaseUIComponent):
             )
             if clicked:
                 self._view_options['wireframe'] = new_wireframe
-                self.logger.debug(f"Wireframe menu toggle: {new_wireframe}")
+                self.view_options_version += 1
+                self.logger.debug("Wireframe menu toggle: %s", new_wireframe)
                 
             # Show Axes toggle
             clicked, new_show_axes = imgui.menu_item(
@@ -91,7 +95,8 @@ class MenuBarComponent(BaseUIComponent):
             )
             if clicked:
                 self._view_options['show_axes'] = new_show_axes
-                self.logger.debug(f"Show axes menu toggle: {new_show_axes}")
+                self.view_options_version += 1
+                self.logger.debug("Show axes menu toggle: %s", new_show_axes)
                 
             imgui.separator()
             
@@ -12,6 +12,7 @@ from core.scene import Scene
 from core.camera import ArcballCamera
 from core.renderer import Renderer
 from core.input_handler import InputHandler
+from config import get_ui_config
 
 
 class ViewportComponent(BaseUIComponent):
@@ -60,13 +61,18 @@ class ViewportComponent(BaseUIComponent):
     def _update_viewport_size(self) -> None:
         """Update viewport size based on available ImGui content region."""
         size = imgui.get_content_region_avail()
-        width, height = max(1, int(size.x)), max(1, int(size.y))
+        # Snap down to whole steps so sub-pixel jitter while a splitter is
+        # dragged does not reallocate the framebuffer every frame. Rounding
+        # down keeps the image inside the region (no scrollbar feedback)
+        step = get_ui_config().VIEWPORT_SIZE_STEP
+        width = max(step, int(size.x) // step * step)
+        height = max(step, int(size.y) // step * step)
 
         if (width, height) != self.viewport_size:
             self.viewport_size = (width, height)
             self.renderer.resize(width, height)
             self.camera.set_viewport(width, height)
-            self.logger.debug(f"Viewport resized to {width}x{height}")
+            self.logger.debug("Viewport resized to %dx%d", width, height)
             
     def _render_scene(self) -> None:
         """Render the 3D scene to the viewport texture."""
@@ -95,8 +101,9 @@ class ViewportComponent(BaseUIComponent):
         if imgui.is_key_pressed(imgui.Key.delete):
             self._on_delete_key_pressed()
             
-        # Get mouse position relative to viewport
-        mouse_pos = imgui.get_mouse_pos()
+        # Get mouse position relative to viewport; mouse state is read from
+        # the already fetched IO struct rather than one binding call per query
+        mouse_pos = io.mouse_pos
         item_pos = imgui.get_item_rect_min()
         x, y = mouse_pos.x - item_pos.x, mouse_pos.y - item_pos.y
         
@@ -120,17 +127,24 @@ class ViewportComponent(BaseUIComponent):
             y: Mouse Y coordinate relative to viewport
             io: ImGui IO object for input state
         """
-        for btn in [0, 1]:  # Left and right mouse buttons
-            if imgui.is_mouse_clicked(btn):
-                if io.key_ctrl and btn == 0:
-                    # Ctrl+Left click for object picking
-                    self._handle_object_picking(x, y)
-                else:
-                    # Regular mouse press
-                    self.input_handler.handle_press(btn, True, x, y)
-                    
-            elif imgui.is_mouse_released(btn):
-                self.input_handler.handle_press(btn, False, x, y)
+        mouse_clicked = io.mouse_clicked
+        mouse_released = io.mouse_released
+        
+        # Left button
+        if mouse_clicked[0]:
+            if io.key_ctrl:
+                # Ctrl+Left click for object picking
+                self._handle_object_picking(x, y)
+            else:
+                self.input_handler.handle_press(0, True, x, y)
+        elif mouse_released[0]:
+            self.input_handler.handle_press(0, False, x, y)
+            
+        # Right button
+        if mouse_clicked[1]:
+            self.input_handler.handle_press(1, True, x, y)
+        elif mouse_released[1]:
+            self.input_handler.handle_press(1, False, x, y)
                 
     def _handle_object_picking(self, x: float, y: float) -> None:
         """
@@ -155,10 +169,10 @@ class ViewportComponent(BaseUIComponent):
     def _on_delete_key_pressed(self) -> None:
         """Handle delete key press for removing selected meshes."""
         try:
-            selected_meshes = [mesh for mesh in self.scene.meshes if mesh.selected]
-            if selected_meshes and hasattr(self, '_delete_callback'):
+            selected_count = self.scene.selected_count
+            if selected_count and hasattr(self, '_delete_callback'):
                 self._delete_callback()
-                self.logger.info(f"Delete key pressed with {len(selected_meshes)} selected meshes")
+                self.logger.info(f"Delete key pressed with {selected_count} selected meshes")
                 
         except Exception as e:
             self.handle_error(e, "delete key handling")
@@ -1,16 +1,55 @@
+import itertools
 import os
 import time
 import trimesh
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from imgui_bundle import hello_imgui, imgui, ImVec2, ImVec4, icons_fontawesome_6
 from pathlib import Path
 
 from core.scene import Scene
+from core.mesh import Mesh
 from core.renderer import Renderer
 from core.camera import ArcballCamera
 from core.input_handler import InputHandler
 from utils.file_io import prompt_load_mesh_paths
 from utils.async_task import TaskManager, TaskStatus
+from utils import mesh_cache
 from ui.progress_overlay import ProgressOverlay
+from config import get_camera_config, get_file_config, get_threading_config, get_ui_config
+
+
+# Controls panel widget labels and styles, built once instead of every frame
+_LOAD_LABEL = f"{icons_fontawesome_6.ICON_FA_FOLDER_OPEN} Load Mesh..."
+_DELETE_LABEL = f"{icons_fontawesome_6.ICON_FA_TRASH} Delete Selected"
+_RESET_LABEL = f"{icons_fontawesome_6.ICON_FA_ARROWS_ROTATE} Reset View"
+_MESH_ICON_LABEL = icons_fontawesome_6.ICON_FA_CUBE + " "
+_SELECTED_ICON_COLOR = imgui.ImVec4(0.4, 0.7, 1.0, 1.0)
+_BUTTON_SIZE_FILL = imgui.ImVec2(-1, 0)
+
+# Theme colors applied by setup_theme (RGBA)
+_THEME_COLORS = (
+    (imgui.Col_.window_bg, (0.08, 0.08, 0.10, 1.00)),
+    (imgui.Col_.child_bg, (0.10, 0.10, 0.12, 1.00)),
+    (imgui.Col_.frame_bg, (0.15, 0.15, 0.18, 1.00)),
+    (imgui.Col_.frame_bg_hovered, (0.20, 0.20, 0.25, 1.00)),
+    (imgui.Col_.frame_bg_active, (0.25, 0.25, 0.30, 1.00)),
+    (imgui.Col_.title_bg, (0.10, 0.10, 0.12, 1.00)),
+    (imgui.Col_.title_bg_active, (0.12, 0.12, 0.15, 1.00)),
+    (imgui.Col_.check_mark, (0.40, 0.70, 1.00, 1.00)),
+    (imgui.Col_.slider_grab, (0.40, 0.70, 1.00, 1.00)),
+    (imgui.Col_.slider_grab_active, (0.50, 0.80, 1.00, 1.00)),
+    (imgui.Col_.button, (0.20, 0.20, 0.25, 1.00)),
+    (imgui.Col_.button_hovered, (0.30, 0.30, 0.35, 1.00)),
+    (imgui.Col_.button_active, (0.25, 0.25, 0.30, 1.00)),
+    (imgui.Col_.header, (0.20, 0.20, 0.25, 1.00)),
+    (imgui.Col_.header_hovered, (0.30, 0.30, 0.35, 1.00)),
+    (imgui.Col_.header_active, (0.25, 0.25, 0.30, 1.00)),
+    (imgui.Col_.separator, (0.30, 0.30, 0.35, 1.00)),
+    (imgui.Col_.separator_hovered, (0.40, 0.40, 0.45, 1.00)),
+    (imgui.Col_.separator_active, (0.50, 0.50, 0.60, 1.00)),
+    (imgui.Col_.text_selected_bg, (0.40, 0.70, 1.00, 0.35)),
+)
 
 
 class MainApplication:
@@ -19,15 +58,34 @@ class MainApplication:
         self.camera = ArcballCamera(800, 600)
         self.input_handler = InputHandler()
         self.renderer = None  
+        # Hoisted out of reset_view, which runs after every load and delete
+        self._reset_zoom_multiplier = get_camera_config().RESET_ZOOM_MULTIPLIER
         self.view_options = {'wireframe': False, 'show_axes': True}
         self.viewport_size = (800, 600)
         self.last_mouse_pos = (0, 0)
-        self.loaded_mesh_paths = set()
+        # Absolute path -> (Mesh, file st_mtime_ns when it was loaded)
+        self.loaded_mesh_paths = {}
         self.font_title = None  # For title fonts
+        # Hidden checkbox IDs per mesh list row ("##vis_0", ...), grown on demand
+        self._visibility_ids = []
+        
+        # Recently deleted meshes, reused when the same unchanged file is reloaded
+        self._recent_meshes = mesh_cache.RecentMeshCache(get_file_config().RECENT_MESH_CACHE_SIZE)
+        
+        # Loaded meshes waiting for GL upload, spread over frames by _upload_pending_meshes
+        self._gl_upload_queue = deque()
+        self._gl_upload_total = 0
+        self._gl_upload_reset_view = False
+        # Load task whose meshes were queued last; the overlay is only touched
+        # while it still shows that load, not one started after it
+        self._gl_upload_task_id = None
         
         # Task management
         self.task_manager = task_manager
         self.progress_overlay = ProgressOverlay()
+        # Task ID suffixes; unlike a seconds timestamp, never repeats for rapid loads
+        self._task_counter = itertools.count()
+        self._idling_enabled = False
 
     def _post_init(self):
         self.renderer = Renderer(*self.viewport_size)
@@ -38,12 +96,13 @@ class MainApplication:
         if not filepaths: return
         
         # Create and start a background task for loading meshes
-        task_id = f"load_meshes_{int(time.time())}"
+        task_id = f"load_meshes_{next(self._task_counter)}"
         task = self.task_manager.create_task(
             task_id, 
             self._load_meshes_task, 
             filepaths
         )
+        task.on_complete = self._process_mesh_loading_results
         task.start()
         
         # Show the progress overlay
@@ -59,58 +118,114 @@ class MainApplication:
     def _load_meshes_task(self, filepaths, report_progress=None, is_canceled=None):
         """Background task for loading meshes."""
         new_mesh_loaded = False
-        results = []
+        # Every file produces exactly one result, so the list is filled in place
+        results = [None] * len(filepaths)
+        loaded_paths = self.loaded_mesh_paths
+        basename = os.path.basename
         
-        for i, path in enumerate(filepaths):
-            # Check for cancellation
-            if is_canceled and is_canceled():
-                # Return what we have so far when canceled
-                return {
-                    "success": new_mesh_loaded,
-                    "results": results,
-                    "canceled": True
-                }
-                
-            # Report progress
-            if report_progress:
-                progress = (i / len(filepaths))
-                report_progress(progress, f"Loading {os.path.basename(path)}...")
-                
-            # Skip duplicates
-            abs_path = os.path.abspath(path)
-            if abs_path in self.loaded_mesh_paths:
-                results.append({
-                    "path": path,
-                    "success": False,
-                    "message": f"Skipping duplicate mesh: {os.path.basename(path)}",
-                    "level": hello_imgui.LogLevel.warning
-                })
-                continue
+        # Parse all requested files concurrently: multi-file loads overlap
+        # their disk reads and parsing instead of one file at a time
+        threading_config = get_threading_config()
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(filepaths), threading_config.DEFAULT_MAX_WORKERS)),
+            thread_name_prefix=f"{threading_config.THREAD_NAME_PREFIX}-Load"
+        ) as load_executor:
+            pending_loads = {}
+            # Canonical paths (symlinks resolved), so the same file reached
+            # through two links is still detected as a duplicate
+            abs_paths = {}
+            # File modification times as of loading, remembered with the mesh
+            mtimes = {}
+            for path in filepaths:
+                abs_path = abs_paths[path] = os.path.realpath(path)
+                if abs_path not in loaded_paths:
+                    # Only looked up here: the entry is dropped once the mesh is
+                    # back in the scene, so a canceled load does not lose it
+                    recent = self._recent_meshes.get(abs_path)
+                    if recent is not None:
+                        # Reloading a mesh deleted this session: no disk I/O or parsing
+                        mtimes[path], recent_mesh = recent
+                        pending_loads[path] = Future()
+                        pending_loads[path].set_result(recent_mesh)
+                    else:
+                        # Taken before parsing, so a file rewritten meanwhile
+                        # is never remembered as unchanged
+                        try:
+                            mtimes[path] = os.stat(abs_path).st_mtime_ns
+                        except OSError:
+                            mtimes[path] = None
+                        pending_loads[path] = load_executor.submit(mesh_cache.get_or_load, path)
             
-            try:
-                # Load the mesh with trimesh first to validate it
-                trimesh_mesh = trimesh.load(path)
-                name = trimesh_mesh.metadata.get('file_name', path.split('/')[-1])
+            # Progress is reported at most once per interval; the final
+            # "Finalizing..." report below always goes through
+            report_interval = threading_config.PROGRESS_REPORT_INTERVAL
+            last_report = float('-inf')
+            
+            for i, path in enumerate(filepaths):
+                # Check for cancellation
+                if is_canceled and is_canceled():
+                    for future in pending_loads.values():
+                        future.cancel()
+                    # Return what we have so far when canceled
+                    return {
+                        "success": new_mesh_loaded,
+                        "results": results[:i],
+                        "canceled": True
+                    }
+                    
+                base_name = basename(path)
                 
-                # Store result for processing in the main thread
-                results.append({
-                    "path": path,
-                    "abs_path": abs_path,
-                    "trimesh_mesh": trimesh_mesh,
-                    "name": name,
-                    "success": True,
-                    "message": f"Loaded mesh: {name}",
-                    "level": hello_imgui.LogLevel.info
-                })
-                new_mesh_loaded = True
+                # Report progress
+                if report_progress:
+                    now = time.monotonic()
+                    if now - last_report >= report_interval:
+                        report_progress(i / len(filepaths), f"Loading {base_name}...")
+                        last_report = now
+                    
+                # Skip duplicates
+                abs_path = abs_paths[path]
+                if path not in pending_loads:
+                    results[i] = {
+                        "path": path,
+                        "success": False,
+                        "message": f"Skipping duplicate mesh: {base_name}",
+                        "level": hello_imgui.LogLevel.warning
+                    }
+                    continue
                 
-            except Exception as e:
-                results.append({
-                    "path": path,
-                    "success": False,
-                    "message": f"Failed to load mesh {path}: {e}",
-                    "level": hello_imgui.LogLevel.error
-                })
+                try:
+                    # Wait for this file's parse so results keep the selection order
+                    trimesh_mesh = pending_loads[path].result()
+                    name = trimesh_mesh.metadata.get('file_name') or base_name
+                    # Validate and build the vertex arrays (including normals)
+                    # here so the main thread only has to upload them
+                    prepared = Mesh.prepare_buffers(trimesh_mesh)
+                    # Meshes are drawn in a flat object color, so texture images
+                    # and vertex colors would only hold RAM for the mesh's lifetime
+                    if getattr(getattr(trimesh_mesh, 'visual', None), 'kind', None) is not None:
+                        trimesh_mesh.visual = trimesh.visual.ColorVisuals()
+                    
+                    # Store result for processing in the main thread
+                    results[i] = {
+                        "path": path,
+                        "abs_path": abs_path,
+                        "mtime_ns": mtimes[path],
+                        "trimesh_mesh": trimesh_mesh,
+                        "prepared": prepared,
+                        "name": name,
+                        "success": True,
+                        "message": f"Loaded mesh: {name}",
+                        "level": hello_imgui.LogLevel.info
+                    }
+                    new_mesh_loaded = True
+                    
+                except Exception as e:
+                    results[i] = {
+                        "path": path,
+                        "success": False,
+                        "message": f"Failed to load mesh {path}: {e}",
+                        "level": hello_imgui.LogLevel.error
+                    }
         
         # Report completion
         if report_progress:
@@ -135,50 +250,94 @@ class MainApplication:
         # If the task was canceled, just log it and clean up
         if result.get("canceled", False):
             hello_imgui.log(hello_imgui.LogLevel.warning, "Mesh loading was canceled")
-            self.progress_overlay.hide()
+            if task_id == self.progress_overlay.active_task_id:
+                self.progress_overlay.hide()
             self.task_manager.remove_task(task_id)
             return
             
-        # Update progress overlay to show we're initializing meshes
-        self.progress_overlay.update(1.0, "Initializing meshes...")
-            
-        # Process each mesh result
+        # Meshes were validated and prepared by the load task, so a bad file
+        # has already been reported as a failed result and cannot fail the batch
         for mesh_result in result["results"]:
             # Log the result
             hello_imgui.log(mesh_result["level"], mesh_result["message"])
             
-            # If successful, add the mesh to the scene
             if mesh_result["success"]:
-                try:
-                    # Create the mesh in the main thread with OpenGL context
-                    mesh = self.scene.create_mesh(
-                        self.renderer.ctx, 
-                        self.renderer.prog, 
-                        mesh_result["trimesh_mesh"], 
-                        mesh_result["name"]
-                    )
-                    
-                    if mesh:
-                        self.scene.meshes.append(mesh)
-                        self.loaded_mesh_paths.add(mesh_result["abs_path"])
-                except Exception as e:
-                    hello_imgui.log(hello_imgui.LogLevel.error, f"Error creating mesh: {e}")
+                self._gl_upload_queue.append(mesh_result)
+                self._gl_upload_total += 1
         
-        # Reset view if any meshes were loaded
+        # Reset view once the queued meshes are uploaded
         if result["success"]:
-            self.reset_view()
+            self._gl_upload_reset_view = True
             
-        # Hide the progress overlay
-        self.progress_overlay.hide()
-        
         # Clean up the task
         self.task_manager.remove_task(task_id)
+        self._gl_upload_task_id = task_id
+        
+        if self._gl_upload_queue:
+            if self._owns_progress_overlay():
+                # The load itself is done, so there is nothing left to cancel
+                self.progress_overlay.cancelable = False
+                self.progress_overlay.update(0.0, "Initializing meshes...")
+        else:
+            self._finish_mesh_uploads()
+
+    def _upload_pending_meshes(self):
+        """Upload queued meshes within a per-frame byte budget, so a large load doesn't stall one frame."""
+        queue = self._gl_upload_queue
+        if not queue:
+            return
+            
+        # Take at least one mesh, then more while they fit the budget
+        budget = get_threading_config().MESH_UPLOAD_BYTES_PER_FRAME
+        batch = []
+        used = 0
+        while queue:
+            prepared = queue[0]["prepared"]
+            size = prepared.vertices.nbytes + prepared.normals.nbytes + prepared.indices.nbytes
+            if batch and used + size > budget:
+                break
+            batch.append(queue.popleft())
+            used += size
+            
+        # Upload in the main thread with OpenGL context, as one shared set of
+        # buffers per frame's batch instead of one set per mesh
+        try:
+            meshes = self.scene.create_meshes(
+                self.renderer.ctx,
+                self.renderer.prog,
+                [(mesh_result["trimesh_mesh"], mesh_result["name"], mesh_result["prepared"])
+                 for mesh_result in batch]
+            )
+            for mesh_result, mesh in zip(batch, meshes):
+                self.scene.append_mesh(mesh)
+                self.loaded_mesh_paths[mesh_result["abs_path"]] = (mesh, mesh_result["mtime_ns"])
+                self._recent_meshes.discard(mesh_result["abs_path"])
+        except Exception as e:
+            hello_imgui.log(hello_imgui.LogLevel.error, f"Error creating meshes: {e}")
+            
+        if queue:
+            if self._owns_progress_overlay():
+                self.progress_overlay.update(1.0 - len(queue) / self._gl_upload_total)
+        else:
+            self._finish_mesh_uploads()
+            
+    def _owns_progress_overlay(self):
+        """Whether the overlay still shows the load whose meshes are being uploaded."""
+        return self.progress_overlay.active_task_id == self._gl_upload_task_id
+            
+    def _finish_mesh_uploads(self):
+        """Reset the view for newly loaded meshes and hide their progress overlay."""
+        if self._gl_upload_reset_view:
+            self.reset_view()
+        self._gl_upload_total = 0
+        self._gl_upload_reset_view = False
+        # A load started since keeps its overlay (and full-rate frames)
+        if self._owns_progress_overlay():
+            self.progress_overlay.hide()
 
     def reset_view(self):
-        from config import get_camera_config
-        camera_config = get_camera_config()
         scale = self.scene.fit_to_view()
-        self.camera.set_zoom(scale * camera_config.RESET_ZOOM_MULTIPLIER)
+        self.camera.set_zoom(scale * self._reset_zoom_multiplier)
         self.scene.reset_transformations()
 
     def _render_menu_bar(self):
@@ -210,13 +369,18 @@ class MainApplication:
         if not selected_indices:
             return
             
+        # Reverse lookup built once, instead of matching names against every path
+        paths_by_mesh = {mesh: path for path, (mesh, _) in self.loaded_mesh_paths.items()}
         for idx in sorted(selected_indices, reverse=True):
             mesh = self.scene.meshes[idx]
-            for path in list(self.loaded_mesh_paths):
-                if mesh.name in path:
-                    self.loaded_mesh_paths.remove(path)
+            path = paths_by_mesh.get(mesh)
+            if path is not None:
+                _, mtime_ns = self.loaded_mesh_paths.pop(path)
+                # Keep the trimesh object for a cheap reload of the unchanged file
+                if mtime_ns is not None:
+                    self._recent_meshes.put(path, mtime_ns, mesh.trimesh_mesh)
             mesh.release()
-            del self.scene.meshes[idx]
+            self.scene.remove_mesh(idx)
         
         hello_imgui.log(hello_imgui.LogLevel.info, f"Deleted {len(selected_indices)} mesh(es).")
         self.reset_view()
@@ -231,13 +395,13 @@ class MainApplication:
         imgui.separator()
 
         # Styled buttons with icons
-        if imgui.button(f"{icons_fontawesome_6.ICON_FA_FOLDER_OPEN} Load Mesh...", imgui.ImVec2(-1, 0)): 
+        if imgui.button(_LOAD_LABEL, _BUTTON_SIZE_FILL): 
             self._load_meshes()
         
-        if imgui.button(f"{icons_fontawesome_6.ICON_FA_TRASH} Delete Selected", imgui.ImVec2(-1, 0)) and any(mesh.selected for mesh in self.scene.meshes): 
+        if imgui.button(_DELETE_LABEL, _BUTTON_SIZE_FILL) and self.scene.any_selected: 
             self._delete_selected_meshes()
             
-        if imgui.button(f"{icons_fontawesome_6.ICON_FA_ARROWS_ROTATE} Reset View", imgui.ImVec2(-1, 0)): 
+        if imgui.button(_RESET_LABEL, _BUTTON_SIZE_FILL): 
             self.reset_view()
 
         # Checkboxes with consistent styling
@@ -257,19 +421,23 @@ class MainApplication:
         if not self.scene.meshes:
             imgui.text("No meshes loaded.")
         else:
-            for i, mesh in enumerate(self.scene.meshes):
-                clicked, mesh.visible = imgui.checkbox(f"##vis_{i}", mesh.visible)
+            meshes = self.scene.meshes
+            visibility_ids = self._visibility_ids
+            if len(visibility_ids) < len(meshes):
+                visibility_ids.extend(f"##vis_{i}" for i in range(len(visibility_ids), len(meshes)))
+                
+            for vis_id, mesh in zip(visibility_ids, meshes):
+                clicked, mesh.visible = imgui.checkbox(vis_id, mesh.visible)
                 imgui.same_line()
                 
                 # Use text_colored instead of push/pop style
-                icon = icons_fontawesome_6.ICON_FA_CUBE
                 if mesh.selected:
-                    imgui.text_colored(imgui.ImVec4(0.4, 0.7, 1.0, 1.0), icon + " ")
+                    imgui.text_colored(_SELECTED_ICON_COLOR, _MESH_ICON_LABEL)
                 else:
-                    imgui.text(icon + " ")
+                    imgui.text(_MESH_ICON_LABEL)
                     
                 imgui.same_line()
-                clicked, mesh.selected = imgui.selectable(f"{mesh.name}", mesh.selected)
+                clicked, mesh.selected = imgui.selectable(mesh.name, mesh.selected)
 
     def _render_info_panel(self):
         # Title with styling
@@ -280,14 +448,15 @@ class MainApplication:
             imgui.pop_font()
         imgui.separator()
         
-        selected_meshes = [m for m in self.scene.meshes if m.selected]
+        # Cached by the scene until the selection changes; the counts text is
+        # formatted once per mesh
+        selected_meshes = self.scene.get_selected_meshes()
         if not selected_meshes:
             imgui.text("No mesh selected.")
         else:
             for mesh in selected_meshes:
-                if imgui.tree_node(f"{mesh.name}"):
-                    imgui.text(f"Vertices: {len(mesh.trimesh_mesh.vertices)}")
-                    imgui.text(f"Faces: {len(mesh.trimesh_mesh.faces)}")
+                if imgui.tree_node(mesh.name):
+                    imgui.text_unformatted(mesh.stats.count_text)
                     imgui.tree_pop()
                     
     def _render_viewport(self):
@@ -305,7 +474,7 @@ class MainApplication:
         
         # Check for delete key press
         io = imgui.get_io()
-        if imgui.is_key_pressed(imgui.Key.delete) and any(mesh.selected for mesh in self.scene.meshes):
+        if imgui.is_key_pressed(imgui.Key.delete) and self.scene.any_selected:
             self._delete_selected_meshes()
         
         if imgui.is_item_hovered():
@@ -332,6 +501,10 @@ class MainApplication:
 
     def _update_tasks(self):
         """Update all background tasks and process completed ones."""
+        # Most frames have no task and no overlay; skip the bookkeeping entirely
+        if not self.task_manager.has_tasks() and not self.progress_overlay.visible:
+            return
+            
         # Check if cancel was requested in the UI
         if self.progress_overlay.visible and self.progress_overlay.cancel_requested:
             self.progress_overlay.cancel_requested = False
@@ -355,9 +528,10 @@ class MainApplication:
                 if task_id == self.progress_overlay.active_task_id:
                     self.progress_overlay.update(task.progress)
                 
-            # Process completed mesh loading tasks
-            if task_id.startswith("load_meshes_") and task.status == TaskStatus.COMPLETED:
-                self._process_mesh_loading_results(task_id)
+            # Hand completed tasks to the handler registered at creation
+            if task.status == TaskStatus.COMPLETED:
+                if task.on_complete is not None:
+                    task.on_complete(task_id)
                 
             # Handle failed tasks
             elif task.status == TaskStatus.FAILED:
@@ -372,6 +546,13 @@ class MainApplication:
                 if task_id == self.progress_overlay.active_task_id:
                     self.progress_overlay.hide()
                 self.task_manager.remove_task(task_id)
+                
+    def _update_idling(self):
+        """Run at full frame rate while a background task shows progress, idle otherwise."""
+        want_idling = get_ui_config().ENABLE_IDLING and not self.progress_overlay.visible
+        if want_idling != self._idling_enabled:
+            hello_imgui.get_runner_params().fps_idling.enable_idling = want_idling
+            self._idling_enabled = want_idling
     
     def run(self):
         runner_params = hello_imgui.RunnerParams()
@@ -386,7 +567,12 @@ class MainApplication:
         runner_params.imgui_window_params.default_imgui_window_type = hello_imgui.DefaultImGuiWindowType.provide_full_screen_dock_space
         runner_params.imgui_window_params.show_menu_bar = True
         runner_params.imgui_window_params.show_status_bar = False
-        runner_params.fps_idling.enable_idling = False
+        # Idle between input events instead of re-submitting identical frames;
+        # input wakes the loop, so drags and zooms still run at full rate
+        ui_config = get_ui_config()
+        runner_params.fps_idling.enable_idling = ui_config.ENABLE_IDLING
+        runner_params.fps_idling.fps_idle = ui_config.IDLE_FPS
+        self._idling_enabled = ui_config.ENABLE_IDLING
         
         # Font loading callback
         def load_fonts():
@@ -415,100 +601,9 @@ class MainApplication:
             style.grab_rounding = 3.0
 
             # Set colors
-            style.set_color_(imgui.Col_.window_bg, imgui.ImVec4(0.08, 0.08, 0.10, 1.00))
-            style.set_color_(imgui.Col_.child_bg, imgui.ImVec4(0.10, 0.10, 0.12, 1.00))
-            style.set_color_(imgui.Col_.frame_bg, imgui.ImVec4(0.15, 0.15, 0.18, 1.00))
-            style.set_color_(imgui.Col_.frame_bg_hovered, imgui.ImVec4(0.20, 0.20, 0.25, 1.00))
-            style.set_color_(imgui.Col_.frame_bg_active, imgui.ImVec4(0.25, 0.25, 0.30, 1.00))
-            style.set_color_(imgui.Col_.title_bg, imgui.ImVec4(0.10, 0.10, 0.12, 1.00))
-            style.set_color_(imgui.Col_.title_bg_active, imgui.ImVec4(0.12, 0.12, 0.15, 1.00))
-            style.set_color_(imgui.Col_.check_mark, imgui.ImVec4(0.40, 0.70, 1.00, 1.00))
-            style.set_color_(imgui.Col_.slider_grab, imgui.ImVec4(0.40, 0.70, 1.00, 1.00))
-            style.set_color_(imgui.Col_.slider_grab_active, imgui.ImVec4(0.50, 0.80, 1.00, 1.00))
-            style.set_color_(imgui.Col_.button, imgui.ImVec4(0.20, 0.20, 0.25, 1.00))
-            style.set_color_(imgui.Col_.button_hovered, imgui.ImVec4(0.30, 0.30, 0.35, 1.00))
-            style.set_color_(imgui.Col_.button_active, imgui.ImVec4(0.25, 0.25, 0.30, 1.00))
-            style.set_color_(imgui.Col_.header, imgui.ImVec4(0.20, 0.20, 0.25, 1.00))
-            style.set_color_(imgui.Col_.header_hovered, imgui.ImVec4(0.30, 0.30, 0.35, 1.00))
-            style.set_color_(imgui.Col_.header_active, imgui.ImVec4(0.25, 0.25, 0.30, 1.00))
-            style.set_color_(imgui.Col_.separator, imgui.ImVec4(0.30, 0.30, 0.35, 1.00))
-            style.set_color_(imgui.Col_.separator_hovered, imgui.ImVec4(0.40, 0.40, 0.45, 1.00))
-            style.set_color_(imgui.Col_.separator_active, imgui.ImVec4(0.50, 0.50, 0.60, 1.00))
-            style.set_color_(imgui.Col_.text_selected_bg, imgui.ImVec4(0.40, 0.70, 1.00, 0.35))
-
-            # hello_imgui.apply_theme( hello_imgui.ImGuiTheme_.so_dark_accent_blue)
-            # tweaked_theme = hello_imgui.get_runner_params().imgui_window_params.tweaked_theme
-            # tweaked_theme.theme = hello_imgui.ImGuiTheme_.darcula_darker
-            # tweaked_theme.tweaks.rounding = 4.0
-            
-            # tweaked_theme.tweaks.value_multiplier_bg = 0.5
-            # tweaked_theme.tweaks.value_multiplier_frame_bg = 0.5
-            
-            # hello_imgui.apply_tweaked_theme(tweaked_theme=tweaked_theme)
-            
-            # imgui.get_style().disabled_alpha     = 0.4000000238418579
-            # imgui.get_style().window_rounding    = 0
-            # imgui.get_style().window_border_size = 0.2
-            # imgui.get_style().window_menu_button_position =  imgui.Dir.right
-            # imgui.get_style().window_padding = (10, 10)
-            # imgui.get_style().frame_rounding      = 4
-            # imgui.get_style().popup_rounding      = 4
-            # imgui.get_style().tab_rounding        = 4
-            # imgui.get_style().tab_bar_border_size = 0
-            # imgui.get_style().frame_padding = (10, 8)
-        
-            # imgui.get_style().set_color_(imgui.Col_.text,                         ImVec4(0.8, 0.8, 0.85, 1.0))
-            # imgui.get_style().set_color_(imgui.Col_.text,                         ImVec4(1.000, 1.000, 1.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.text_disabled,                ImVec4(0.500, 0.500, 0.500, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.window_bg,                    ImVec4(0.149, 0.149, 0.149, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.child_bg,                     ImVec4(0.280, 0.280, 0.280, 0.000))
-            # imgui.get_style().set_color_(imgui.Col_.popup_bg,                     ImVec4(0.106, 0.106, 0.106, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.border,                       ImVec4(0.077, 0.077, 0.077, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.border_shadow,                ImVec4(0.000, 0.000, 0.000, 0.000))
-            # imgui.get_style().set_color_(imgui.Col_.frame_bg,                     ImVec4(0.105, 0.105, 0.105, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.frame_bg_hovered,             ImVec4(1.000, 1.000, 1.000, 0.127)) #new System.Numerics.Vector4(0.271f, 0.251f, 0.197f, 1.000f);
-            # imgui.get_style().set_color_(imgui.Col_.frame_bg_active,              ImVec4(0.280, 0.280, 0.280, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.title_bg,                     ImVec4(0.082, 0.082, 0.082, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.title_bg_active,              ImVec4(0.082, 0.082, 0.082, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.title_bg_collapsed,           ImVec4(0.082, 0.082, 0.082, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.menu_bar_bg,                  ImVec4(0.102, 0.102, 0.102, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.scrollbar_bg,                 ImVec4(0.129, 0.129, 0.129, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.scrollbar_grab,               ImVec4(0.277, 0.277, 0.277, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.scrollbar_grab_hovered,       ImVec4(0.391, 0.391, 0.391, 1.000)) # //new System.Numerics.Vector4(0.300f, 0.300f, 0.300f, 1.000f); 
-            # imgui.get_style().set_color_(imgui.Col_.scrollbar_grab_active,        ImVec4(1.000, 0.391, 0.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.check_mark,                   ImVec4(1.000, 1.000, 1.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.slider_grab,                  ImVec4(0.391, 0.391, 0.391, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.slider_grab_active,           ImVec4(1.000, 0.391, 0.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.button,                       ImVec4(1.000, 1.000, 1.000, 0.065))
-            # imgui.get_style().set_color_(imgui.Col_.button_hovered,               imgui.get_style().color_(imgui.Col_.frame_bg_hovered)) 
-            # imgui.get_style().set_color_(imgui.Col_.header,                       ImVec4(0.188, 0.188, 0.188, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.header_hovered,               imgui.get_style().color_(imgui.Col_.frame_bg_hovered)) 
-            # imgui.get_style().set_color_(imgui.Col_.header_active,                ImVec4(0.469, 0.469, 0.469, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.separator,                    ImVec4(0.129, 0.129, 0.129, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.separator_hovered,            imgui.get_style().color_(imgui.Col_.scrollbar_grab_hovered))
-            # imgui.get_style().set_color_(imgui.Col_.separator_active,             ImVec4(1.000, 0.391, 0.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.resize_grip,                  ImVec4(1.000, 1.000, 1.000, 0.250))
-            # imgui.get_style().set_color_(imgui.Col_.resize_grip_hovered,          imgui.get_style().color_(imgui.Col_.scrollbar_grab_hovered)) 
-            # imgui.get_style().set_color_(imgui.Col_.resize_grip_active,           ImVec4(1.000, 0.391, 0.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.tab,                          ImVec4(0.098, 0.098, 0.098, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.tab_hovered,                  imgui.get_style().color_(imgui.Col_.frame_bg_hovered))
-            # imgui.get_style().set_color_(imgui.Col_.tab_dimmed,                   imgui.get_style().color_(imgui.Col_.tab_dimmed_selected_overline)) 
-            # imgui.get_style().set_color_(imgui.Col_.tab_dimmed_selected,          ImVec4(0.149, 0.149, 0.149, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.tab_dimmed_selected_overline, ImVec4(0.195, 0.195, 0.195, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.tab_selected,                 ImVec4(0.149, 0.149, 0.149, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.tab_selected_overline,        ImVec4(0.949, 0.149, 0.149, 0.300))
-            # imgui.get_style().set_color_(imgui.Col_.docking_preview,              ImVec4(1.000, 0.391, 0.000, 0.781))
-            # imgui.get_style().set_color_(imgui.Col_.docking_empty_bg,             ImVec4(0.180, 0.180, 0.180, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.plot_lines,                   ImVec4(0.469, 0.469, 0.469, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.plot_lines_hovered,           ImVec4(1.000, 0.391, 0.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.plot_histogram,               ImVec4(0.586, 0.586, 0.586, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.plot_histogram_hovered,       ImVec4(1.000, 0.391, 0.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.text_selected_bg,             ImVec4(1.000, 1.000, 1.000, 0.156))
-            # imgui.get_style().set_color_(imgui.Col_.drag_drop_target,             ImVec4(1.000, 0.391, 0.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.nav_windowing_highlight,      ImVec4(1.000, 0.391, 0.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.nav_windowing_highlight,      ImVec4(1.000, 0.391, 0.000, 1.000))
-            # imgui.get_style().set_color_(imgui.Col_.nav_windowing_dim_bg,         ImVec4(0.000, 0.000, 0.000, 0.586))
-            # imgui.get_style().set_color_(imgui.Col_.modal_window_dim_bg,          ImVec4(0.000, 0.000, 0.000, 0.586))
+            set_color = style.set_color_
+            for col, rgba in _THEME_COLORS:
+                set_color(col, imgui.ImVec4(*rgba))
         
         runner_params.callbacks.setup_imgui_style = setup_theme
         
@@ -517,6 +612,8 @@ class MainApplication:
         # Add a frame callback to update tasks
         def before_imgui_render():
             self._update_tasks()
+            self._upload_pending_meshes()
+            self._update_idling()
             self.progress_overlay.render()
             
         runner_params.callbacks.before_imgui_render = before_imgui_render
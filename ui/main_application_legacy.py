@@ -159,7 +159,7 @@ class MainApplication:
                     )
                     
                     if mesh:
-                        self.scene.meshes.append(mesh)
+                        self.scene.append_mesh(mesh)
                         self.loaded_mesh_paths.add(mesh_result["abs_path"])
                 except Exception as e:
                     hello_imgui.log(hello_imgui.LogLevel.error, f"Error creating mesh: {e}")
@@ -216,7 +216,7 @@ class MainApplication:
                 if mesh.name in path:
                     self.loaded_mesh_paths.remove(path)
             mesh.release()
-            del self.scene.meshes[idx]
+            self.scene.remove_mesh(idx)
         
         hello_imgui.log(hello_imgui.LogLevel.info, f"Deleted {len(selected_indices)} mesh(es).")
         self.reset_view()
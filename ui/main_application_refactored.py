@@ -6,22 +6,25 @@ instead of monolithic rendering methods. This improves maintainability, testabil
 and separation of concerns.
 """
 
+import itertools
 import os
-import time
-import trimesh
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any
 from imgui_bundle import hello_imgui, imgui, ImVec2
 from pathlib import Path
 
 # Core modules
 from core.scene import Scene
+from core.mesh import Mesh
 from core.renderer import Renderer
 from core.camera import ArcballCamera
 from core.input_handler import InputHandler
+from config import get_camera_config, get_threading_config, get_ui_config
 
 # Utility modules
 from utils.file_io import prompt_load_mesh_paths
 from utils.async_task import TaskManager, TaskStatus
+from utils import mesh_cache
 from utils.logging import get_logger
 
 # UI components and managers
@@ -55,12 +58,22 @@ class MainApplication:
         self.camera = ArcballCamera(800, 600)
         self.input_handler = InputHandler()
         self.renderer = None  # Initialized in post_init
+        # Hoisted out of reset_view, which runs after every load and delete
+        self._reset_zoom_multiplier = get_camera_config().RESET_ZOOM_MULTIPLIER
         
         # Managers
         self.ui_state_manager = UIStateManager()
         self.theme_manager = ThemeManager()
         self.task_manager = task_manager
         self.progress_overlay = ProgressOverlay()
+        # Source file of each loaded mesh, so deleting one forgets its exact path
+        self._mesh_paths: Dict[Mesh, str] = {}
+        # Task ID suffixes; unlike a seconds timestamp, never repeats for rapid loads
+        self._task_counter = itertools.count()
+        self._idling_enabled = False
+        # Component view option versions already pushed by _sync_view_options
+        self._menu_options_version = 0
+        self._controls_options_version = 0
         
         # UI Components
         self._initialize_components()
@@ -119,26 +132,28 @@ class MainApplication:
         
     def _sync_view_options(self) -> None:
         """Synchronize view options between components and state manager."""
-        # Get current view options from the state manager
-        current_state_options = self.ui_state_manager.view_options.copy()
-        
-        # Get view options from components (they may have been changed by user)
-        menu_options = self.menu_bar.get_view_options()
-        controls_options = self.controls_panel.get_view_options()
-        
-        # Check if any component has different options
-        if menu_options != current_state_options:
-            # Update state manager with menu changes
-            self.ui_state_manager.view_options = menu_options
-            # Sync to other components
-            self.controls_panel.set_view_options(menu_options)
-            self.viewport.set_view_options(menu_options)
-        elif controls_options != current_state_options:
-            # Update state manager with controls changes
-            self.ui_state_manager.view_options = controls_options
-            # Sync to other components
-            self.menu_bar.set_view_options(controls_options)
-            self.viewport.set_view_options(controls_options)
+        # This runs every frame; components bump their version when the user
+        # changes an option, so the steady state is two integer compares
+        menu_version = self.menu_bar.view_options_version
+        controls_version = self.controls_panel.view_options_version
+        if menu_version != self._menu_options_version:
+            self._menu_options_version = menu_version
+            menu_options = self.menu_bar.get_view_options()
+            if not self.ui_state_manager.matches_view_options(menu_options):
+                # Update state manager with menu changes
+                self.ui_state_manager.view_options = menu_options
+                # Sync to other components
+                self.controls_panel.set_view_options(menu_options)
+                self.viewport.set_view_options(menu_options)
+        elif controls_version != self._controls_options_version:
+            self._controls_options_version = controls_version
+            controls_options = self.controls_panel.get_view_options()
+            if not self.ui_state_manager.matches_view_options(controls_options):
+                # Update state manager with controls changes
+                self.ui_state_manager.view_options = controls_options
+                # Sync to other components
+                self.menu_bar.set_view_options(controls_options)
+                self.viewport.set_view_options(controls_options)
         
     def _post_init(self) -> None:
         """Post-initialization callback called by hello_imgui."""
@@ -171,12 +186,13 @@ class MainApplication:
                 return
                 
             # Create and start background task
-            task_id = f"load_meshes_{int(time.time())}"
+            task_id = f"load_meshes_{next(self._task_counter)}"
             task = self.task_manager.create_task(
                 task_id, 
                 self._load_meshes_task, 
                 filepaths
             )
+            task.on_complete = self._process_mesh_loading_results
             task.start()
             
             # Show progress overlay
@@ -197,57 +213,85 @@ class MainApplication:
     def _load_meshes_task(self, filepaths, report_progress=None, is_canceled=None):
         """Background task for loading meshes."""
         new_mesh_loaded = False
-        results = []
+        # Every file produces exactly one result, so the list is filled in place
+        # and keeps the selection order whatever order the files finish in
+        results = [None] * len(filepaths)
         
-        for i, path in enumerate(filepaths):
-            # Check for cancellation
-            if is_canceled and is_canceled():
-                return {
-                    "success": new_mesh_loaded,
-                    "results": results,
-                    "canceled": True
-                }
-                
-            # Report progress
-            if report_progress:
-                progress = (i / len(filepaths))
-                report_progress(progress, f"Loading {os.path.basename(path)}...")
-                
-            # Skip duplicates
-            abs_path = os.path.abspath(path)
-            if abs_path in self.ui_state_manager.loaded_mesh_paths:
-                results.append({
-                    "path": path,
-                    "success": False,
-                    "message": f"Skipping duplicate mesh: {os.path.basename(path)}",
-                    "level": hello_imgui.LogLevel.warning
-                })
-                continue
-            
-            try:
-                # Load the mesh with trimesh first to validate it
-                trimesh_mesh = trimesh.load(path)
-                name = trimesh_mesh.metadata.get('file_name', path.split('/')[-1])
+        # Parse all requested files concurrently: multi-file loads overlap
+        # their disk reads instead of waiting on one file at a time
+        threading_config = get_threading_config()
+        # Snapshot the loaded paths once: the main thread adds to the set while
+        # this task runs, and hashed lookups keep the duplicate check O(1).
+        # Paths are added as they are submitted, so a file selected twice loads once
+        seen_paths = set(self.ui_state_manager.loaded_mesh_paths)
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(filepaths), threading_config.DEFAULT_MAX_WORKERS)),
+            thread_name_prefix=f"{threading_config.THREAD_NAME_PREFIX}-Load"
+        ) as load_executor:
+            pending_loads = {}  # future -> index into filepaths
+            abs_paths = []
+            for i, path in enumerate(filepaths):
+                abs_path = os.path.abspath(path)
+                abs_paths.append(abs_path)
+                if abs_path in seen_paths:
+                    results[i] = {
+                        "path": path,
+                        "success": False,
+                        "message": f"Skipping duplicate mesh: {os.path.basename(path)}",
+                        "level": hello_imgui.LogLevel.warning
+                    }
+                    continue
+                seen_paths.add(abs_path)
+                pending_loads[load_executor.submit(mesh_cache.get_or_load, path)] = i
+            
+            # Validate files as they finish rather than in selection order, so a
+            # large first file doesn't hold up preparing the ones after it
+            for completed, future in enumerate(as_completed(pending_loads), 1):
+                # Check for cancellation
+                if is_canceled and is_canceled():
+                    for pending in pending_loads:
+                        pending.cancel()
+                    return {
+                        "success": new_mesh_loaded,
+                        "results": [result for result in results if result is not None],
+                        "canceled": True
+                    }
+                    
+                i = pending_loads[future]
+                path = filepaths[i]
                 
-                # Store result for processing in the main thread
-                results.append({
-                    "path": path,
-                    "abs_path": abs_path,
-                    "trimesh_mesh": trimesh_mesh,
-                    "name": name,
-                    "success": True,
-                    "message": f"Loaded mesh: {name}",
-                    "level": hello_imgui.LogLevel.info
-                })
-                new_mesh_loaded = True
+                # Report progress
+                if report_progress:
+                    progress = completed / len(pending_loads)
+                    report_progress(progress, f"Loaded {os.path.basename(path)}")
                 
-            except Exception as e:
-                results.append({
-                    "path": path,
-                    "success": False,
-                    "message": f"Failed to load mesh {path}: {e}",
-                    "level": hello_imgui.LogLevel.error
-                })
+                try:
+                    trimesh_mesh = future.result()
+                    name = trimesh_mesh.metadata.get('file_name') or os.path.basename(path)
+                    # Validate and build the vertex arrays here so the main
+                    # thread only has to upload them
+                    prepared = Mesh.prepare_buffers(trimesh_mesh)
+                    
+                    # Store result for processing in the main thread
+                    results[i] = {
+                        "path": path,
+                        "abs_path": abs_paths[i],
+                        "trimesh_mesh": trimesh_mesh,
+                        "prepared": prepared,
+                        "name": name,
+                        "success": True,
+                        "message": f"Loaded mesh: {name}",
+                        "level": hello_imgui.LogLevel.info
+                    }
+                    new_mesh_loaded = True
+                    
+                except Exception as e:
+                    results[i] = {
+                        "path": path,
+                        "success": False,
+                        "message": f"Failed to load mesh {path}: {e}",
+                        "level": hello_imgui.LogLevel.error
+                    }
         
         # Report completion
         if report_progress:
@@ -292,12 +336,14 @@ class MainApplication:
                         self.renderer.ctx, 
                         self.renderer.prog, 
                         mesh_result["trimesh_mesh"], 
-                        mesh_result["name"]
+                        mesh_result["name"],
+                        mesh_result["prepared"]
                     )
                     
                     if mesh:
-                        self.scene.meshes.append(mesh)
+                        self.scene.append_mesh(mesh)
                         self.ui_state_manager.add_mesh_path(mesh_result["abs_path"])
+                        self._mesh_paths[mesh] = mesh_result["abs_path"]
                         
                 except Exception as e:
                     hello_imgui.log(hello_imgui.LogLevel.error, f"Error creating mesh: {e}")
@@ -317,6 +363,7 @@ class MainApplication:
         try:
             self.scene.clear()
             self.ui_state_manager.clear_mesh_paths()
+            self._mesh_paths.clear()
             self.reset_view()
             hello_imgui.log(hello_imgui.LogLevel.info, "Cleared all meshes.")
             self.logger.info("All meshes cleared")
@@ -339,13 +386,13 @@ class MainApplication:
                 mesh = self.scene.meshes[idx]
                 
                 # Remove from loaded paths
-                for path in list(self.ui_state_manager.loaded_mesh_paths):
-                    if mesh.name in path:
-                        self.ui_state_manager.remove_mesh_path(path)
+                path = self._mesh_paths.pop(mesh, None)
+                if path is not None:
+                    self.ui_state_manager.remove_mesh_path(path)
                         
                 # Release resources and remove from scene
                 mesh.release()
-                del self.scene.meshes[idx]
+                self.scene.remove_mesh(idx)
             
             hello_imgui.log(hello_imgui.LogLevel.info, f"Deleted {len(selected_indices)} mesh(es).")
             self.logger.info(f"Deleted {len(selected_indices)} selected meshes")
@@ -357,11 +404,8 @@ class MainApplication:
     def reset_view(self) -> None:
         """Reset the camera view to fit all meshes."""
         try:
-            from config import get_camera_config
-            camera_config = get_camera_config()
-            
             scale = self.scene.fit_to_view()
-            self.camera.set_zoom(scale * camera_config.RESET_ZOOM_MULTIPLIER)
+            self.camera.set_zoom(scale * self._reset_zoom_multiplier)
             self.scene.reset_transformations()
             
             self.logger.debug("View reset completed")
@@ -371,6 +415,10 @@ class MainApplication:
             
     def _update_tasks(self) -> None:
         """Update all background tasks and process completed ones."""
+        # Most frames have no task and no overlay; skip the bookkeeping entirely
+        if not self.task_manager.has_tasks() and not self.progress_overlay.visible:
+            return
+            
         try:
             # Check if cancel was requested in the UI
             if self.progress_overlay.visible and self.progress_overlay.cancel_requested:
@@ -391,9 +439,10 @@ class MainApplication:
                     if task_id == self.progress_overlay.active_task_id:
                         self.progress_overlay.update(task.progress)
                     
-                # Process completed mesh loading tasks
-                if task_id.startswith("load_meshes_") and task.status == TaskStatus.COMPLETED:
-                    self._process_mesh_loading_results(task_id)
+                # Hand completed tasks to the handler registered at creation
+                if task.status == TaskStatus.COMPLETED:
+                    if task.on_complete is not None:
+                        task.on_complete(task_id)
                     
                 # Handle failed tasks
                 elif task.status == TaskStatus.FAILED:
@@ -412,10 +461,18 @@ class MainApplication:
         except Exception as e:
             self.logger.error(f"Error updating tasks: {e}")
             
+    def _update_idling(self) -> None:
+        """Run at full frame rate while a background task shows progress, idle otherwise."""
+        want_idling = get_ui_config().ENABLE_IDLING and not self.progress_overlay.visible
+        if want_idling != self._idling_enabled:
+            hello_imgui.get_runner_params().fps_idling.enable_idling = want_idling
+            self._idling_enabled = want_idling
+            
     def _before_imgui_render(self) -> None:
         """Callback called before ImGui rendering each frame."""
         try:
             self._update_tasks()
+            self._update_idling()
             self._sync_view_options()  # Keep view options synchronized
             self.progress_overlay.render()
             
@@ -444,7 +501,18 @@ class MainApplication:
             )
             runner_params.imgui_window_params.show_menu_bar = True
             runner_params.imgui_window_params.show_status_bar = False
-            runner_params.fps_idling.enable_idling = False
+            
+            # Idle between input events instead of re-submitting identical frames
+            ui_config = get_ui_config()
+            runner_params.fps_idling.enable_idling = ui_config.ENABLE_IDLING
+            runner_params.fps_idling.fps_idle = ui_config.IDLE_FPS
+            # Older hello_imgui builds have neither setting and always wait for vsync
+            fps_idling = runner_params.fps_idling
+            if hasattr(fps_idling, 'vsync_to_monitor'):
+                fps_idling.vsync_to_monitor = ui_config.VSYNC_TO_MONITOR
+                if not ui_config.VSYNC_TO_MONITOR and hasattr(fps_idling, 'fps_max'):
+                    fps_idling.fps_max = ui_config.MAX_FPS
+            self._idling_enabled = ui_config.ENABLE_IDLING
             
             # Setup callbacks
             runner_params.callbacks.load_additional_fonts = self.theme_manager.create_font_callback()
@@ -10,6 +10,31 @@ from imgui_bundle import imgui, hello_imgui, ImVec2, ImVec4
 from utils.logging import get_logger
 
 
+# Dark theme colors, built once at import; set_color_ copies each value
+_COLOR_SCHEME = (
+    (imgui.Col_.window_bg, ImVec4(0.08, 0.08, 0.10, 1.00)),
+    (imgui.Col_.child_bg, ImVec4(0.10, 0.10, 0.12, 1.00)),
+    (imgui.Col_.frame_bg, ImVec4(0.15, 0.15, 0.18, 1.00)),
+    (imgui.Col_.frame_bg_hovered, ImVec4(0.20, 0.20, 0.25, 1.00)),
+    (imgui.Col_.frame_bg_active, ImVec4(0.25, 0.25, 0.30, 1.00)),
+    (imgui.Col_.title_bg, ImVec4(0.10, 0.10, 0.12, 1.00)),
+    (imgui.Col_.title_bg_active, ImVec4(0.12, 0.12, 0.15, 1.00)),
+    (imgui.Col_.check_mark, ImVec4(0.40, 0.70, 1.00, 1.00)),
+    (imgui.Col_.slider_grab, ImVec4(0.40, 0.70, 1.00, 1.00)),
+    (imgui.Col_.slider_grab_active, ImVec4(0.50, 0.80, 1.00, 1.00)),
+    (imgui.Col_.button, ImVec4(0.20, 0.20, 0.25, 1.00)),
+    (imgui.Col_.button_hovered, ImVec4(0.30, 0.30, 0.35, 1.00)),
+    (imgui.Col_.button_active, ImVec4(0.25, 0.25, 0.30, 1.00)),
+    (imgui.Col_.header, ImVec4(0.20, 0.20, 0.25, 1.00)),
+    (imgui.Col_.header_hovered, ImVec4(0.30, 0.30, 0.35, 1.00)),
+    (imgui.Col_.header_active, ImVec4(0.25, 0.25, 0.30, 1.00)),
+    (imgui.Col_.separator, ImVec4(0.30, 0.30, 0.35, 1.00)),
+    (imgui.Col_.separator_hovered, ImVec4(0.40, 0.40, 0.45, 1.00)),
+    (imgui.Col_.separator_active, ImVec4(0.50, 0.50, 0.60, 1.00)),
+    (imgui.Col_.text_selected_bg, ImVec4(0.40, 0.70, 1.00, 0.35)),
+)
+
+
 class ThemeManager:
     """
     Manager class for UI theming and styling.
@@ -25,6 +50,8 @@ class ThemeManager:
         """Initialize the theme manager."""
         self.logger = get_logger("ui.theme_manager")
         self.font_title: Optional = None
+        # Reused by apply_accent_color for derived colors; set_color_ copies it
+        self._accent_scratch = ImVec4(0.0, 0.0, 0.0, 0.0)
         
     def setup_theme(self) -> None:
         """Setup the complete UI theme including colors and styling."""
@@ -56,35 +83,9 @@ class ThemeManager:
         
     def _setup_color_scheme(self) -> None:
         """Configure the color scheme for the UI."""
-        style = imgui.get_style()
-        
-        # Dark theme colors
-        color_config = {
-            imgui.Col_.window_bg: ImVec4(0.08, 0.08, 0.10, 1.00),
-            imgui.Col_.child_bg: ImVec4(0.10, 0.10, 0.12, 1.00),
-            imgui.Col_.frame_bg: ImVec4(0.15, 0.15, 0.18, 1.00),
-            imgui.Col_.frame_bg_hovered: ImVec4(0.20, 0.20, 0.25, 1.00),
-            imgui.Col_.frame_bg_active: ImVec4(0.25, 0.25, 0.30, 1.00),
-            imgui.Col_.title_bg: ImVec4(0.10, 0.10, 0.12, 1.00),
-            imgui.Col_.title_bg_active: ImVec4(0.12, 0.12, 0.15, 1.00),
-            imgui.Col_.check_mark: ImVec4(0.40, 0.70, 1.00, 1.00),
-            imgui.Col_.slider_grab: ImVec4(0.40, 0.70, 1.00, 1.00),
-            imgui.Col_.slider_grab_active: ImVec4(0.50, 0.80, 1.00, 1.00),
-            imgui.Col_.button: ImVec4(0.20, 0.20, 0.25, 1.00),
-            imgui.Col_.button_hovered: ImVec4(0.30, 0.30, 0.35, 1.00),
-            imgui.Col_.button_active: ImVec4(0.25, 0.25, 0.30, 1.00),
-            imgui.Col_.header: ImVec4(0.20, 0.20, 0.25, 1.00),
-            imgui.Col_.header_hovered: ImVec4(0.30, 0.30, 0.35, 1.00),
-            imgui.Col_.header_active: ImVec4(0.25, 0.25, 0.30, 1.00),
-            imgui.Col_.separator: ImVec4(0.30, 0.30, 0.35, 1.00),
-            imgui.Col_.separator_hovered: ImVec4(0.40, 0.40, 0.45, 1.00),
-            imgui.Col_.separator_active: ImVec4(0.50, 0.50, 0.60, 1.00),
-            imgui.Col_.text_selected_bg: ImVec4(0.40, 0.70, 1.00, 0.35)
-        }
-        
-        # Apply colors
-        for color_id, color_value in color_config.items():
-            style.set_color_(color_id, color_value)
+        set_color = imgui.get_style().set_color_
+        for color_id, color_value in _COLOR_SCHEME:
+            set_color(color_id, color_value)
             
         self.logger.debug("Color scheme configured")
         
@@ -132,23 +133,23 @@ class ThemeManager:
         Args:
             color: The accent color to apply
         """
-        style = imgui.get_style()
+        set_color = imgui.get_style().set_color_
+        scratch = self._accent_scratch
         
         # Apply accent color to specific elements
-        style.set_color_(imgui.Col_.check_mark, color)
-        style.set_color_(imgui.Col_.slider_grab, color)
-        style.set_color_(imgui.Col_.text_selected_bg, ImVec4(color.x, color.y, color.z, 0.35))
+        set_color(imgui.Col_.check_mark, color)
+        set_color(imgui.Col_.slider_grab, color)
+        scratch.x, scratch.y, scratch.z, scratch.w = color.x, color.y, color.z, 0.35
+        set_color(imgui.Col_.text_selected_bg, scratch)
         
         # Lighter version for active states
-        active_color = ImVec4(
-            min(1.0, color.x + 0.1),
-            min(1.0, color.y + 0.1), 
-            min(1.0, color.z + 0.1),
-            color.w
-        )
-        style.set_color_(imgui.Col_.slider_grab_active, active_color)
-        
-        self.logger.debug(f"Applied accent color: {color.x:.2f}, {color.y:.2f}, {color.z:.2f}")
+        scratch.x = min(1.0, color.x + 0.1)
+        scratch.y = min(1.0, color.y + 0.1)
+        scratch.z = min(1.0, color.z + 0.1)
+        scratch.w = color.w
+        set_color(imgui.Col_.slider_grab_active, scratch)
+        
+        self.logger.debug("Applied accent color: %.2f, %.2f, %.2f", color.x, color.y, color.z)
         
     def get_style_summary(self) -> dict:
         """
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from utils.logging import get_logger
 
 
-@dataclass
+@dataclass(slots=True)
 class ViewOptions:
     """Container for view-related options."""
     wireframe: bool = False
@@ -48,6 +48,22 @@ class UIStateManager:
             'show_axes': self._state.view_options.show_axes
         }
         
+    def matches_view_options(self, options: Dict[str, Any]) -> bool:
+        """
+        Check whether an options dictionary equals the current view options.
+        
+        Compares field by field, without building the compatibility dictionary.
+        
+        Args:
+            options: Dictionary containing view settings
+            
+        Returns:
+            True if every view option matches the current state
+        """
+        view_options = self._state.view_options
+        return (options.get('wireframe') == view_options.wireframe
+                and options.get('show_axes') == view_options.show_axes)
+        
     @view_options.setter
     def view_options(self, options: Dict[str, Any]) -> None:
         """Set view options from a dictionary."""
@@ -61,7 +77,7 @@ class UIStateManager:
         # Notify observers if options changed
         if old_options != self.view_options:
             self._notify_observers('view_options', old_options, self.view_options)
-            self.logger.debug(f"View options updated: {self.view_options}")
+            self.logger.debug("View options updated: %s", self._state.view_options)
             
     def set_wireframe(self, enabled: bool) -> None:
         """
@@ -74,7 +90,7 @@ class UIStateManager:
             old_value = self._state.view_options.wireframe
             self._state.view_options.wireframe = enabled
             self._notify_observers('wireframe', old_value, enabled)
-            self.logger.debug(f"Wireframe mode: {enabled}")
+            self.logger.debug("Wireframe mode: %s", enabled)
             
     def set_show_axes(self, enabled: bool) -> None:
         """
@@ -87,7 +103,7 @@ class UIStateManager:
             old_value = self._state.view_options.show_axes
             self._state.view_options.show_axes = enabled
             self._notify_observers('show_axes', old_value, enabled)
-            self.logger.debug(f"Show axes: {enabled}")
+            self.logger.debug("Show axes: %s", enabled)
             
     @property
     def loaded_mesh_paths(self) -> Set[str]:
@@ -104,7 +120,7 @@ class UIStateManager:
         if path not in self._state.loaded_mesh_paths:
             self._state.loaded_mesh_paths.add(path)
             self._notify_observers('mesh_added', None, path)
-            self.logger.debug(f"Added mesh path: {path}")
+            self.logger.debug("Added mesh path: %s", path)
             
     def remove_mesh_path(self, path: str) -> None:
         """
@@ -116,7 +132,7 @@ class UIStateManager:
         if path in self._state.loaded_mesh_paths:
             self._state.loaded_mesh_paths.remove(path)
             self._notify_observers('mesh_removed', path, None)
-            self.logger.debug(f"Removed mesh path: {path}")
+            self.logger.debug("Removed mesh path: %s", path)
             
     def clear_mesh_paths(self) -> None:
         """Clear all loaded mesh paths."""
@@ -138,7 +154,7 @@ class UIStateManager:
             old_size = self._state.viewport_size
             self._state.viewport_size = size
             self._notify_observers('viewport_size', old_size, size)
-            self.logger.debug(f"Viewport size changed: {size}")
+            self.logger.debug("Viewport size changed: %s", size)
             
     @property
     def last_mouse_pos(self) -> tuple:
@@ -161,7 +177,7 @@ class UIStateManager:
         if event_type not in self._observers:
             self._observers[event_type] = []
         self._observers[event_type].append(callback)
-        self.logger.debug(f"Registered observer for {event_type}")
+        self.logger.debug("Registered observer for %s", event_type)
         
     def unregister_observer(self, event_type: str, callback: callable) -> None:
         """
@@ -174,7 +190,7 @@ class UIStateManager:
         if event_type in self._observers:
             if callback in self._observers[event_type]:
                 self._observers[event_type].remove(callback)
-                self.logger.debug(f"Unregistered observer for {event_type}")
+                self.logger.debug("Unregistered observer for %s", event_type)
                 
     def _notify_observers(self, event_type: str, old_value: Any, new_value: Any) -> None:
         """
@@ -88,7 +88,7 @@ class MainApplication:
             try:
                 # Load the mesh with trimesh first to validate it
                 trimesh_mesh = trimesh.load(path)
-                name = trimesh_mesh.metadata.get('file_name', path.split('/')[-1])
+                name = trimesh_mesh.metadata.get('file_name') or os.path.basename(path)
                 
                 # Store result for processing in the main thread
                 results.append({
@@ -157,7 +157,7 @@ class MainApplication:
                     )
                     
                     if mesh:
-                        self.scene.meshes.append(mesh)
+                        self.scene.append_mesh(mesh)
                         self.loaded_mesh_paths.add(mesh_result["abs_path"])
                 except Exception as e:
                     hello_imgui.log(hello_imgui.LogLevel.error, f"Error creating mesh: {e}")
@@ -214,7 +214,7 @@ class MainApplication:
                 if mesh.name in path:
                     self.loaded_mesh_paths.remove(path)
             mesh.release()
-            del self.scene.meshes[idx]
+            self.scene.remove_mesh(idx)
         
         hello_imgui.log(hello_imgui.LogLevel.info, f"Deleted {len(selected_indices)} mesh(es).")
         self.reset_view()
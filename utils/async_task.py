@@ -18,7 +18,8 @@ class AsyncTask:
     """
     A class for executing functions asynchronously with progress reporting.
     """
-    def __init__(self, task_id: str, func: Callable, args: tuple = (), kwargs: dict = None):
+    def __init__(self, task_id: str, func: Callable, args: tuple = (), kwargs: dict = None,
+                 on_event: Optional[Callable[[str], None]] = None):
         """
         Initialize an async task.
         
@@ -27,6 +28,8 @@ class AsyncTask:
             func: The function to execute asynchronously
             args: Positional arguments to pass to the function
             kwargs: Keyword arguments to pass to the function
+            on_event: Called with the task ID (from any thread) whenever the
+                task has progress, a result or a cancellation to process
         """
         self.task_id = task_id
         self.func = func
@@ -41,6 +44,14 @@ class AsyncTask:
         self._progress_queue = queue.Queue()
         self._result_queue = queue.Queue()
         self._cancel_event = threading.Event()
+        self._on_event = on_event
+        # Optional handler the owner calls with the task ID once the task completes
+        self.on_complete: Optional[Callable[[str], None]] = None
+        
+    def _notify(self):
+        """Tell the owner that update() has something to process."""
+        if self._on_event is not None:
+            self._on_event(self.task_id)
         
     def start(self):
         """Start the task in a background thread."""
@@ -86,15 +97,23 @@ class AsyncTask:
         except Exception as e:
             # Always put the error in the queue, even if canceled
             self._result_queue.put((False, e))
+        self._notify()
     
     def _report_progress(self, progress: float, message: str = ""):
         """Report progress from the worker thread."""
         if 0.0 <= progress <= 1.0:
             self._progress_queue.put((progress, message))
+            self._notify()
     
     def _is_canceled(self) -> bool:
         """Check if the task has been canceled."""
         return self._cancel_event.is_set()
+        
+    def _worker_finished(self) -> bool:
+        """Check whether the worker is done, or will never run (a canceled pool submission)."""
+        if self._future is not None:
+            return self._future.done()
+        return self.thread is None or not self.thread.is_alive()
     
     def cancel(self):
         """Request cancellation of the task."""
@@ -106,6 +125,7 @@ class AsyncTask:
             # Cancel the future if it exists
             if self._future:
                 self._future.cancel()
+            self._notify()
     
     def update(self) -> bool:
         """
@@ -128,8 +148,8 @@ class AsyncTask:
                     self.result = result
                 self.status = TaskStatus.CANCELED
                 return True
-            # Otherwise just mark as canceled if thread is done
-            if not self.thread.is_alive():
+            # Otherwise just mark as canceled if the worker is done
+            if self._worker_finished():
                 self.status = TaskStatus.CANCELED
                 return True
         
@@ -176,6 +196,9 @@ class TaskManager:
             thread_name_prefix=threading_config.THREAD_NAME_PREFIX
         )
         self._active_task_count = 0
+        # IDs of tasks with something for update() to process, pushed by the
+        # tasks themselves so update_all() does not have to poll every task
+        self._events: "queue.SimpleQueue[str]" = queue.SimpleQueue()
         
     def create_task(self, task_id: str, func: Callable, *args, **kwargs) -> AsyncTask:
         """
@@ -190,7 +213,7 @@ class TaskManager:
         Returns:
             AsyncTask: The created task
         """
-        task = AsyncTask(task_id, func, args, kwargs)
+        task = AsyncTask(task_id, func, args, kwargs, on_event=self._events.put)
         self.tasks[task_id] = task
         return task
         
@@ -233,22 +256,44 @@ class TaskManager:
         Returns:
             List[str]: List of task IDs that had state changes
         """
+        # Called every frame: with no pending events this is a single check
+        if self._events.empty():
+            return []
+            
+        # Drain the events, visiting each signalled task once in signal order
+        signalled = {}
+        while True:
+            try:
+                signalled[self._events.get_nowait()] = None
+            except queue.Empty:
+                break
+                
         changed_tasks = []
-        for task_id, task in list(self.tasks.items()):
-            if task.update():
+        for task_id in signalled:
+            task = self.tasks.get(task_id)
+            if task is None:
+                continue
+            try:
+                changed = task.update()
+            except Exception as e:
+                # Its events are already drained, so a task left RUNNING here
+                # would never be looked at again; fail it instead
+                task.error = e
+                task.status = TaskStatus.FAILED
+                changed = True
+            if changed:
                 changed_tasks.append(task_id)
                 
-            # Clean up completed/failed/canceled tasks after some time
-            if task.status != TaskStatus.RUNNING and task.status != TaskStatus.PENDING:
-                # In a real app, you might want to keep them around longer or log them
-                pass
-                
         return changed_tasks
         
     def get_task(self, task_id: str) -> Optional[AsyncTask]:
         """Get a task by ID."""
         return self.tasks.get(task_id)
         
+    def has_tasks(self) -> bool:
+        """Whether any task is registered, finished tasks included until removed."""
+        return bool(self.tasks)
+        
     def remove_task(self, task_id: str) -> bool:
         """Remove a task from the manager."""
         if task_id in self.tasks:
@@ -173,7 +173,7 @@ def log_performance(func):
         try:
             result = func(*args, **kwargs)
             elapsed = time.time() - start_time
-            logger.debug(f"{func.__name__} completed in {elapsed:.4f}s")
+            logger.debug("%s completed in %.4fs", func.__name__, elapsed)
             return result
         except Exception as e:
             elapsed = time.time() - start_time
@@ -216,7 +216,7 @@ def log_mesh_load(mesh_name: str, vertex_count: int, face_count: int, load_time:
 def log_render_stats(fps: float, frame_time: float, mesh_count: int):
     """Log rendering performance statistics."""
     logger = get_logger('render')
-    logger.debug(f"FPS: {fps:.1f}, Frame time: {frame_time:.3f}ms, Meshes: {mesh_count}")
+    logger.debug("FPS: %.1f, Frame time: %.3fms, Meshes: %d", fps, frame_time, mesh_count)
 
 
 def log_user_action(action: str, details: str = ""):
@@ -0,0 +1,253 @@
+"""
+Persistent on-disk cache of parsed mesh geometry.
+
+Parsing text formats such as OBJ or ASCII STL dominates load time for large
+files. The vertex, face and vertex-normal arrays of each loaded mesh are stored
+as an .npz file keyed by the source path, size and modification time, so
+reloading an unchanged file skips the parser entirely.
+
+RecentMeshCache additionally keeps the trimesh objects of recently deleted
+meshes in memory, so reloading one of them skips even the cache read.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+import trimesh
+
+from config import get_file_config
+from utils.logging import get_logger
+
+logger = get_logger('mesh_cache')
+
+_CACHE_SUFFIX = ".npz"
+
+# trimesh.load options for FileSettings.FAST_MESH_LOADING: no vertex merging or
+# cleanup passes, no material/texture I/O, and scenes flattened to one mesh
+_FAST_LOAD_OPTIONS = dict(process=False, maintain_order=True, skip_materials=True, force='mesh')
+
+
+def load_mesh_file(path: str):
+    """
+    Parse a mesh file with trimesh, honouring FileSettings.FAST_MESH_LOADING.
+    
+    Args:
+        path: Path to the mesh file
+        
+    Returns:
+        The loaded trimesh object
+    """
+    if get_file_config().FAST_MESH_LOADING:
+        return trimesh.load(path, **_FAST_LOAD_OPTIONS)
+    return trimesh.load(path)
+
+
+def cache_key(path: str) -> str:
+    """
+    Build the cache key for a mesh file.
+    
+    The key changes whenever the file is modified or the loading mode changes,
+    so stale entries are never returned; they simply age out of the cache.
+    
+    Args:
+        path: Path to the mesh file
+        
+    Returns:
+        Hex digest identifying this version of the file
+    """
+    abs_path = os.path.realpath(path)
+    stat = os.stat(abs_path)
+    mode = "fast" if get_file_config().FAST_MESH_LOADING else "full"
+    # Hash the path instead of using it raw: it may be long or contain separators
+    return hashlib.blake2b(
+        f"{abs_path}|{stat.st_mtime_ns}|{stat.st_size}|{mode}".encode(), digest_size=20
+    ).hexdigest()
+
+
+def get_or_load(path: str, cache_dir: Optional[str] = None):
+    """
+    Load a mesh file, using the on-disk geometry cache when possible.
+    
+    Only single meshes are cached; scenes and other geometry types returned by
+    trimesh.load are passed through unchanged. Cache failures are logged and
+    never prevent the file from loading.
+    
+    Args:
+        path: Path to the mesh file
+        cache_dir: Cache directory; defaults to FileSettings.MESH_CACHE_DIR
+        
+    Returns:
+        The loaded trimesh object
+    """
+    file_config = get_file_config()
+    if not file_config.MESH_CACHE_ENABLED:
+        return load_mesh_file(path)
+        
+    cache_dir = os.path.expanduser(cache_dir or file_config.MESH_CACHE_DIR)
+    try:
+        entry = os.path.join(cache_dir, cache_key(path) + _CACHE_SUFFIX)
+    except OSError:
+        # Let trimesh report missing or unreadable files
+        return load_mesh_file(path)
+        
+    if os.path.exists(entry):
+        try:
+            return _read_entry(entry, path)
+        except Exception as e:
+            logger.warning("Discarding unreadable mesh cache entry %s: %s", entry, e)
+            _remove_quietly(entry)
+            
+    trimesh_mesh = load_mesh_file(path)
+    if isinstance(trimesh_mesh, trimesh.Trimesh):
+        try:
+            _write_entry(cache_dir, entry, trimesh_mesh)
+            _evict(cache_dir, file_config.MESH_CACHE_MAX_BYTES)
+        except Exception as e:
+            logger.warning("Could not cache mesh %s: %s", path, e)
+    return trimesh_mesh
+
+
+def _read_entry(entry: str, path: str) -> trimesh.Trimesh:
+    """Rebuild a mesh from a cache entry and mark the entry as recently used."""
+    with np.load(entry, allow_pickle=False) as data:
+        trimesh_mesh = trimesh.Trimesh(
+            vertices=data["vertices"],
+            faces=data["faces"],
+            vertex_normals=data["vertex_normals"],
+            metadata={'file_name': os.path.basename(path)},
+            process=False,
+        )
+    # Eviction is least-recently-used by modification time
+    os.utime(entry)
+    logger.debug("Loaded %s from mesh cache", path)
+    return trimesh_mesh
+
+
+def _write_entry(cache_dir: str, entry: str, trimesh_mesh: trimesh.Trimesh) -> None:
+    """Store a mesh's arrays, writing to a temporary file so readers never see partial entries."""
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f,
+                vertices=trimesh_mesh.vertices,
+                faces=trimesh_mesh.faces,
+                vertex_normals=trimesh_mesh.vertex_normals,
+            )
+        os.replace(temp_path, entry)
+    except BaseException:
+        _remove_quietly(temp_path)
+        raise
+
+
+def _evict(cache_dir: str, max_bytes: int) -> None:
+    """Delete least recently used entries until the cache fits in max_bytes."""
+    entries = []
+    total = 0
+    with os.scandir(cache_dir) as it:
+        for dir_entry in it:
+            if dir_entry.name.endswith(_CACHE_SUFFIX) and dir_entry.is_file():
+                stat = dir_entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, dir_entry.path))
+                total += stat.st_size
+                
+    if total <= max_bytes:
+        return
+        
+    entries.sort()
+    for _, size, entry_path in entries:
+        _remove_quietly(entry_path)
+        total -= size
+        if total <= max_bytes:
+            break
+
+
+def _remove_quietly(path: str) -> None:
+    """Remove a file, ignoring files that are already gone."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class RecentMeshCache:
+    """
+    Thread-safe LRU of trimesh objects of recently deleted meshes.
+    
+    Entries are keyed by absolute path and remember the file's modification
+    time from when the mesh was loaded, so a file changed on disk since then
+    is never served from memory.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize the cache.
+        
+        Args:
+            capacity: Maximum number of meshes kept
+        """
+        self.capacity = capacity
+        self._entries: "OrderedDict[str, Tuple[int, trimesh.Trimesh]]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+    def __len__(self) -> int:
+        return len(self._entries)
+        
+    def put(self, abs_path: str, mtime_ns: int, trimesh_mesh: trimesh.Trimesh) -> None:
+        """
+        Remember a mesh, evicting the least recently used ones beyond capacity.
+        
+        Args:
+            abs_path: Absolute path the mesh was loaded from
+            mtime_ns: The file's st_mtime_ns when the mesh was loaded
+            trimesh_mesh: The loaded mesh
+        """
+        with self._lock:
+            self._entries[abs_path] = (mtime_ns, trimesh_mesh)
+            self._entries.move_to_end(abs_path)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                
+    def get(self, abs_path: str) -> Optional[Tuple[int, trimesh.Trimesh]]:
+        """
+        Look up a remembered mesh whose file is unchanged.
+        
+        The entry is kept, so a load that is canceled before the mesh reaches
+        the scene does not lose it; call discard() once the mesh is back.
+        Stale entries are dropped.
+        
+        Args:
+            abs_path: Absolute path of the mesh file
+            
+        Returns:
+            (mtime_ns, trimesh_mesh), or None if unknown or modified on disk
+        """
+        with self._lock:
+            entry = self._entries.get(abs_path)
+        if entry is None:
+            return None
+        try:
+            current_mtime = os.stat(abs_path).st_mtime_ns
+        except OSError:
+            current_mtime = None
+        if current_mtime != entry[0]:
+            with self._lock:
+                # Unless a newer entry replaced it meanwhile
+                if self._entries.get(abs_path) is entry:
+                    del self._entries[abs_path]
+            return None
+        with self._lock:
+            if abs_path in self._entries:
+                self._entries.move_to_end(abs_path)
+        return entry
+        
+    def discard(self, abs_path: str) -> None:
+        """Forget a remembered mesh, if present."""
+        with self._lock:
+            self._entries.pop(abs_path, None)